@@ -3,14 +3,20 @@ Dotfiles Manager - Modular Architecture
 A clean, extensible dotfiles management application with separated concerns.
 """
 
+import importlib
+
 __version__ = "2.0.0"
 __author__ = "Dotfiles Manager"
 
-from .core.config_manager import ConfigManager
-from .core.git_manager import GitManager
-from .core.file_manager import FileManager
-from .interfaces.ui_interface import UIInterface
-from .ui.rich_ui import RichUI
+# Public names are imported on first access (PEP 562) so that importing the
+# package, e.g. for the core managers, does not pull in the Rich UI stack
+_LAZY_IMPORTS = {
+    'ConfigManager': '.core.config_manager',
+    'GitManager': '.core.git_manager',
+    'FileManager': '.core.file_manager',
+    'UIInterface': '.interfaces.ui_interface',
+    'RichUI': '.ui.rich_ui',
+}
 
 __all__ = [
     'ConfigManager',
@@ -18,4 +24,16 @@ __all__ = [
     'FileManager',
     'UIInterface',
     'RichUI'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache for subsequent lookups
+    return value
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
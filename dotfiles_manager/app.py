@@ -4,15 +4,15 @@ Coordinates all components and manages the application lifecycle.
 """
 
 import os
-import time
+import queue
 from typing import Optional
 
 from .core.config_manager import ConfigManager
 from .core.git_manager import GitManager
 from .core.file_manager import FileManager
-from .core.logger import Logger
+from .core.status_cache import StatusCache
+from .core.file_watcher import FileWatcher
 from .interfaces.ui_interface import UIInterface
-from .ui.rich_ui import RichUI
 
 class DotfilesApp:
     """Main application coordinator"""
@@ -20,12 +20,27 @@ class DotfilesApp:
     def __init__(self, ui: Optional[UIInterface] = None):
         # Core managers
         self.config_manager = ConfigManager()
-        self.logger = Logger(self.config_manager.config)
+        self.logger = self._create_logger()
         self.git_manager = GitManager(self.config_manager)
+        # Warm git caches while the UI is being set up
+        self.git_manager.start_prefetch()
         self.file_manager = FileManager(self.config_manager)
 
-        # UI implementation (default to RichUI)
-        self.ui = ui if ui is not None else RichUI()
+        # Cached git status for the modified files view
+        self.status_cache = StatusCache(self.git_manager.get_current_changes)
+
+        # Results of background git commands (action, success, error), drained by the UI loops
+        self.command_queue: "queue.Queue[tuple[str, bool, str]]" = queue.Queue()
+
+        # Work tree watcher - git status is only re-queried after real changes
+        self.file_watcher: Optional[FileWatcher] = None
+        self._start_file_watcher()
+
+        # UI implementation (default to RichUI, imported only when needed)
+        if ui is None:
+            from .ui.rich_ui import RichUI
+            ui = RichUI()
+        self.ui = ui
 
     def run(self):
         """Main application loop"""
@@ -35,6 +50,7 @@ class DotfilesApp:
 
         try:
             while True:
+                self._process_command_results()
                 choice = self.ui.show_main_menu()
 
                 if choice == "1":  # Browse Files
@@ -57,7 +73,88 @@ class DotfilesApp:
         except Exception as e:
             self.ui.show_error(f"Unexpected error: {e}")
         finally:
+            if self.file_watcher:
+                self.file_watcher.stop()
+            self.git_manager.close()
             self.ui.cleanup()
+            if self.git_manager.is_push_in_progress():
+                # Exiting would otherwise block silently on the push thread
+                print("Waiting for push to finish...")
+                self.git_manager.wait_for_pushes()
+
+    def _push_in_progress(self, message: str) -> bool:
+        """Tell the user an action must wait for the background push, True if one is running"""
+        if not self.git_manager.is_push_in_progress():
+            return False
+
+        self.ui.show_info(message)
+        self.ui.schedule_dismiss_after(1.5)
+        return True
+
+    def _start_push(self):
+        """Start a push in the background, its result is reported by _process_command_results"""
+        if self._push_in_progress("A push is already in progress"):
+            return
+
+        try:
+            thread = self.git_manager.push_changes_async(
+                lambda success, error: self.command_queue.put(("push", success, error))
+            )
+        except Exception as e:
+            self.ui.show_error(f"Error during push: {str(e)}")
+            self.logger.log_error(e, "push")
+            self.ui.schedule_dismiss_after(1.5)
+            return
+
+        if thread is not None:
+            self.ui.show_info("Push started in background")
+            self.ui.schedule_dismiss_after(1)
+
+    def _process_command_results(self):
+        """Report results of background git commands that finished since the last check"""
+        while True:
+            try:
+                action, success, error = self.command_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if action == "push":
+                self.status_cache.invalidate()
+                if success:
+                    self.ui.show_success("Push completed successfully!")
+                    self.logger.log_info("Push successful to remote repository", "push")
+                else:
+                    self.ui.show_error("Error during push!")
+                    self.logger.log_error(Exception(f"Push failed: {error.strip()}"), "push")
+                self.ui.schedule_dismiss_after(1.5)
+
+    def _create_logger(self):
+        """Build a logger for the current configuration (imported only when needed, like RichUI)"""
+        from .core.logger import Logger
+        return Logger(self.config_manager.config)
+
+    def _start_file_watcher(self):
+        """(Re)start the work tree watcher for the current configuration"""
+        if self.file_watcher:
+            self.file_watcher.stop()
+
+        self.file_watcher = FileWatcher(
+            self.config_manager.work_tree_path,
+            self.config_manager.git_dir_path,
+            self.git_manager.get_tracked_set
+        )
+        if not self.file_watcher.start():
+            self.logger.log_info("File watcher unavailable, git status refreshes on every view", "file_watcher")
+
+    def _get_current_changes(self):
+        """Get current changes, re-querying git only when the work tree changed"""
+        if self.file_watcher and self.file_watcher.is_running:
+            if self.file_watcher.consume_changes():
+                self.status_cache.invalidate()
+            # Cached status stays valid until an event arrives (bounded by max_age)
+            return self.status_cache.get_or_refresh(ttl=self.status_cache.max_age)
+
+        return self.status_cache.get_or_refresh()
 
     def _handle_file_browser(self):
         """Handle file browser functionality"""
@@ -75,6 +172,7 @@ class DotfilesApp:
 
             try:
                 success, added_files, failed_files = self.git_manager.add_files(selected_files)
+                self.status_cache.invalidate()
 
                 if success:
                     if len(added_files) == len(selected_files):
@@ -93,7 +191,7 @@ class DotfilesApp:
                         # Log each failed file with its specific error
                         for file_path, error_msg in failed_files.items():
                             self.logger.log_error(Exception(f"{os.path.basename(file_path)}: {error_msg}"), "git_add")
-                    time.sleep(2)
+                    self.ui.schedule_dismiss_after(2)
                 else:
                     self.ui.show_error("Error adding files - check details above")
                     self.logger.log_error(Exception(f"Git Add COMPLETE FAILURE: Failed to add all {len(selected_files)} files"), "git_add")
@@ -101,19 +199,20 @@ class DotfilesApp:
                     # Log each failed file with its specific error
                     for file_path, error_msg in failed_files.items():
                         self.logger.log_error(Exception(f"{os.path.basename(file_path)}: {error_msg}"), "git_add")
-                    time.sleep(2)
+                    self.ui.schedule_dismiss_after(2)
             except Exception as e:
                 self.ui.show_error(f"Unexpected error during addition: {str(e)}")
                 self.logger.log_error(Exception(f"Git Add UNEXPECTED ERROR: {str(e)}"), "git_add")
                 self.logger.log_info(f"Attempted files: {', '.join(selected_files)}", "git_add")
                 self.logger.log_info("SOLUTION: Check system permissions, disk space, and git installation", "git_add")
-                time.sleep(2)
+                self.ui.schedule_dismiss_after(2)
 
     def _handle_modified_files(self):
         """Handle modified files display and actions"""
         while True:
-            changes = self.git_manager.get_current_changes()
-            result = self.ui.show_modified_files(changes)
+            self._process_command_results()
+            changes = self._get_current_changes()
+            result = self.ui.show_modified_files(changes, self.git_manager)
 
             if not result:
                 # User pressed 'q' - exit to main menu
@@ -122,101 +221,95 @@ class DotfilesApp:
             action = result.get("action")
 
             if action == "commit":
+                if self._push_in_progress("A push is in progress - commit once it has finished"):
+                    continue
                 message = result.get("message", "update dotfiles")
                 self.ui.show_progress("Executing commit")
                 try:
-                    if self.git_manager.commit_changes(message):
+                    committed = self.git_manager.commit_changes(message)
+                    self.status_cache.invalidate()
+                    if committed:
                         self.ui.show_success("Commit completed successfully!")
                         self.logger.log_info(f"Commit successful: {message}", "commit")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
 
                         # Check if there are commits to push
                         if self.ui.show_push_status(self.git_manager):
-                            self.ui.show_progress("Executing push")
-                            if self.git_manager.push_changes():
-                                self.ui.show_success("Push completed successfully!")
-                                time.sleep(1.5)
-                            else:
-                                self.ui.show_error("Error during push!")
-                                time.sleep(1.5)
+                            self._start_push()
 
                         # Continue loop to refresh the list
                     else:
                         self.ui.show_error("Error during commit!")
                         self.logger.log_error(Exception("Commit failed"), "commit")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
                 except Exception as e:
                     self.ui.show_error(f"Error during commit: {str(e)}")
                     self.logger.log_error(e, "commit")
-                    time.sleep(1.5)
+                    self.ui.schedule_dismiss_after(1.5)
 
             elif action == "push":
-                self.ui.show_progress("Executing push")
-                try:
-                    if self.git_manager.push_changes():
-                        self.ui.show_success("Push completed successfully!")
-                        self.logger.log_info("Push successful to remote repository", "push")
-                        time.sleep(1.5)
-                        # Continue loop to refresh the list
-                    else:
-                        self.ui.show_error("Error during push!")
-                        self.logger.log_error(Exception("Push failed"), "push")
-                        time.sleep(1.5)
-                except Exception as e:
-                    self.ui.show_error(f"Error during push: {str(e)}")
-                    self.logger.log_error(e, "push")
-                    time.sleep(1.5)
+                self._start_push()
 
             elif action == "pull":
+                if self._push_in_progress("A push is in progress - pull once it has finished"):
+                    continue
                 self.ui.show_progress("Executing pull")
                 try:
-                    if self.git_manager.pull_changes():
+                    pulled = self.git_manager.pull_changes()
+                    self.status_cache.invalidate()
+                    if pulled:
                         self.ui.show_success("Pull completed successfully!")
                         self.logger.log_info("Pull successful from remote repository", "pull")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
                         # Continue loop to refresh the list
                     else:
                         self.ui.show_error("Error during pull!")
                         self.logger.log_error(Exception("Pull failed"), "pull")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
                 except Exception as e:
                     self.ui.show_error(f"Error during pull: {str(e)}")
                     self.logger.log_error(e, "pull")
-                    time.sleep(1.5)
+                    self.ui.schedule_dismiss_after(1.5)
 
             elif action == "unstage_all":
                 self.ui.show_progress("Removing from staging")
-                if self.git_manager.unstage_all_changes():
+                unstaged = self.git_manager.unstage_all_changes()
+                self.status_cache.invalidate()
+                if unstaged:
                     self.ui.show_success("Changes removed from staging!")
-                    time.sleep(1.5)
+                    self.ui.schedule_dismiss_after(1.5)
                     # Continue loop to refresh the list
                 else:
                     self.ui.show_error("Error removing from staging!")
-                    time.sleep(1.5)
+                    self.ui.schedule_dismiss_after(1.5)
 
             elif action == "unstage_file":
                 file_path = result.get("file")
                 if file_path:
                     self.ui.show_progress(f"Removing {file_path} from staging")
-                    if self.git_manager.unstage_single_file(file_path):
+                    unstaged = self.git_manager.unstage_single_file(file_path)
+                    self.status_cache.invalidate()
+                    if unstaged:
                         self.ui.show_success(f"File '{file_path}' removed from staging!")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
                         # Continue loop to refresh the list
                     else:
                         self.ui.show_error(f"Error removing '{file_path}' from staging!")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
 
             elif action == "unstage_files":
                 file_paths = result.get("files", [])
                 if file_paths:
                     self.ui.show_progress(f"Removing {len(file_paths)} files from staging")
-                    if self.git_manager.unstage_multiple_files(file_paths):
+                    unstaged = self.git_manager.unstage_multiple_files(file_paths)
+                    self.status_cache.invalidate()
+                    if unstaged:
                         self.ui.show_success(f"{len(file_paths)} files removed from staging!")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
                         # Continue loop to refresh the list
                     else:
                         self.ui.show_error("Error removing files from staging!")
-                        time.sleep(1.5)
+                        self.ui.schedule_dismiss_after(1.5)
 
     def _handle_tracked_files(self):
         """Handle tracked files display"""
@@ -258,6 +351,10 @@ class DotfilesApp:
             new_remote = new_config.get('remote', '')
 
             if self.config_manager.update_config(**new_config):
+                # Paths may have changed - cached status no longer applies
+                self.status_cache.invalidate()
+                self._start_file_watcher()
+
                 # Update git remote if it changed and git repo is initialized
                 if old_remote != new_remote and self.git_manager.is_git_repo_initialized():
                     if new_remote:
@@ -277,13 +374,12 @@ class DotfilesApp:
                 new_logging_enabled = new_config.get('enable_logging', False)
                 if not old_logging_enabled and new_logging_enabled:
                     # Logging was just enabled - create new logger and log the event
-                    from .core.logger import Logger
-                    new_logger = Logger(self.config_manager.config)
+                    new_logger = self._create_logger()
                     new_logger.log_info("Logging enabled by user", "settings")
                     self.logger = new_logger  # Update app logger instance
 
                 self.ui.show_success("Configuration saved!")
-                time.sleep(1)
+                self.ui.schedule_dismiss_after(1)
             else:
                 self.ui.show_error("Error saving configuration!")
 
@@ -294,9 +390,11 @@ class DotfilesApp:
         # Show detailed initialization interface
         if self.ui.initialize_git_repo_detailed(config):
             self.ui.show_progress("Initializing Git repository")
-            if self.git_manager.initialize_git_repo():
+            initialized = self.git_manager.initialize_git_repo()
+            self.status_cache.invalidate()
+            if initialized:
                 self.ui.show_success("Repository initialized successfully!")
-                time.sleep(1.5)
+                self.ui.schedule_dismiss_after(1.5)
             else:
                 self.ui.show_error("Error during initialization!")
 
@@ -306,4 +404,4 @@ class DotfilesApp:
 
     def _manage_backup(self):
         """Manage backup files"""
-        self.ui.show_backup_manager()
\ No newline at end of file
+        self.ui.show_backup_manager(self.git_manager)
\ No newline at end of file
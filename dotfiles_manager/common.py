@@ -3,8 +3,11 @@ Common constants, types and utilities
 """
 
 import os
+import shutil
+import stat
 import sys
-from typing import Dict, List, Any, Optional, Set, Tuple
+import time
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 # Color constants - Lime theme
@@ -70,8 +73,8 @@ class KeyCodes:
     # Delete key
     DELETE = '\x1b[3~'
 
-# Data structures
-@dataclass
+# Data structures (slotted; listing items are immutable snapshots)
+@dataclass(slots=True)
 class Config:
     """Configuration data structure"""
     git_dir: str = "~/.dotfiles.git"
@@ -91,7 +94,7 @@ class Config:
     def from_dict(cls, data: Dict[str, Any]) -> 'Config':
         return cls(**data)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileInfo:
     """Information about a tracked file"""
     path: str
@@ -105,16 +108,16 @@ class FileInfo:
         """Display name for UI"""
         return os.path.basename(self.path) if self.path != '.' else '.'
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DirectoryItem:
     """Information about a directory item"""
     path: str
     full_path: str
-    type: str  # 'file', 'directory', 'parent'
+    type: str  # 'file', 'directory', 'parent', hidden_ and ignored_ variants
     size: int = 0
     mtime: float = 0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GitChange:
     """Information about a git change"""
     file: str
@@ -127,35 +130,119 @@ def expand_path(path: str) -> str:
     """Expand user path with proper handling"""
     return os.path.expanduser(path)
 
+def _copy_file_range(src: str, dst: str) -> os.stat_result:
+    """Copy file contents inside the kernel (reflink on CoW filesystems), returns the source stat"""
+    with open(src, 'rb') as fsrc:
+        st = os.fstat(fsrc.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # Pseudo files may report size 0 and still have content
+            raise OSError("copy_file_range needs a regular file with a known size")
+
+        with open(dst, 'wb') as fdst:
+            remaining = st.st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    raise OSError("copy_file_range stopped early")
+                remaining -= copied
+
+    return st
+
+def fast_copy2(src: str, dst: str) -> str:
+    """Copy a file with its mode and timestamps like shutil.copy2, using in-kernel copy when possible"""
+    try:
+        if not hasattr(os, 'copy_file_range'):
+            raise OSError("copy_file_range not available")
+        st = _copy_file_range(src, dst)
+    except OSError:
+        # Unsupported filesystem or kernel - copyfile still uses sendfile on Linux
+        shutil.copyfile(src, dst)
+        st = os.stat(src)
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+# Size units and their exact byte multipliers (powers of 1024)
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+_SIZE_SCALES = (1, 1 << 10, 1 << 20, 1 << 30, 1 << 40)
+
 def format_file_size(size_bytes: int) -> str:
     """Convert file size to human readable string"""
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = int(abs(size_bytes).bit_length() - 1) // 10
-    i = min(i, len(size_names) - 1)
+    # Unit index from the bit length: every 10 bits is another factor of 1024
+    i = min((abs(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+
+    return f"{size_bytes / _SIZE_SCALES[i]:.1f} {_SIZE_NAMES[i]}"
 
-    size = size_bytes / (1024 ** i)
-    return f"{size:.1f} {size_names[i]}"
+# Current local day as (year, day of year), refreshed at most once per second
+_TODAY_TTL = 1.0
+_today: Tuple[int, int] = (0, 0)
+_today_checked_at: Optional[float] = None
+
+def _current_day() -> Tuple[int, int]:
+    """Get today's (year, day of year), cached for rendering many rows"""
+    global _today, _today_checked_at
+
+    now = time.monotonic()
+    if _today_checked_at is None or now - _today_checked_at >= _TODAY_TTL:
+        local_now = time.localtime()
+        _today = (local_now.tm_year, local_now.tm_yday)
+        _today_checked_at = now
+    return _today
 
 def format_file_mtime(mtime: float) -> str:
     """Convert modification time to human readable string"""
     try:
-        import datetime
-        dt = datetime.datetime.fromtimestamp(mtime)
-        now = datetime.datetime.now()
+        local = time.localtime(mtime)
+        year, yday = _current_day()
 
         # If today, show time only
-        if dt.date() == now.date():
-            return dt.strftime("%H:%M")
+        if local.tm_year == year and local.tm_yday == yday:
+            return time.strftime("%H:%M", local)
 
         # If this year, show month and day
-        if dt.year == now.year:
-            return dt.strftime("%b %d")
+        if local.tm_year == year:
+            return time.strftime("%b %d", local)
 
         # Otherwise show year
-        return dt.strftime("%Y")
-
-    except (ValueError, OSError):
-        return "Unknown"
\ No newline at end of file
+        return time.strftime("%Y", local)
+
+    except (ValueError, OSError, OverflowError):
+        return "Unknown"
+
+def format_file_sizes(sizes: Iterable[int]) -> List[str]:
+    """Format many file sizes in one pass (one call per table render)"""
+    names, scales, last = _SIZE_NAMES, _SIZE_SCALES, len(_SIZE_NAMES) - 1
+    result = []
+
+    for size in sizes:
+        if size == 0:
+            result.append("0 B")
+            continue
+        i = min((abs(size).bit_length() - 1) // 10, last)
+        result.append(f"{size / scales[i]:.1f} {names[i]}")
+
+    return result
+
+def format_file_mtimes(mtimes: Iterable[float]) -> List[str]:
+    """Format many modification times in one pass, resolving the current day once"""
+    year, yday = _current_day()
+    localtime, strftime = time.localtime, time.strftime
+    result = []
+
+    for mtime in mtimes:
+        try:
+            local = localtime(mtime)
+            if local.tm_year != year:
+                result.append(strftime("%Y", local))
+            elif local.tm_yday == yday:
+                result.append(strftime("%H:%M", local))
+            else:
+                result.append(strftime("%b %d", local))
+        except (ValueError, OSError, OverflowError):
+            result.append("Unknown")
+
+    return result
@@ -5,32 +5,95 @@ Handles application configuration with JSON persistence.
 
 import os
 import json
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from ..common import Config
 
+# Optional C-accelerated JSON - falls back to the stdlib parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON from raw bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes with a 2-space indent"""
+    # Same layout on both paths (orjson only supports 2 spaces), so installing or
+    # removing orjson does not reformat config.json
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 class ConfigManager:
     """Manages application configuration with JSON persistence"""
 
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(self, config_path: str = "config.json", durable_writes: bool = True):
         self.config_path = config_path
+        # fsync before replacing the config file; disable for fast, non-durable saves
+        self.durable_writes = durable_writes
         self._config: Optional[Config] = None
+        self._config_mtime: Optional[int] = None
+        self._expanded_paths: Dict[str, str] = {}
+        # Bumped whenever the config is (re)loaded or saved, so dependents can cache derived values
+        self._version = 0
 
     @property
     def config(self) -> Config:
-        """Lazy load configuration"""
-        if self._config is None:
+        """Lazy load configuration, reloading if the file changed on disk"""
+        if self._config is None or self._get_file_mtime() != self._config_mtime:
             self._config = self.load_config()
+            self._version += 1
         return self._config
 
+    @property
+    def version(self) -> int:
+        """Token that changes whenever the configuration may have changed"""
+        self.config  # Reload first if the file changed on disk
+        return self._version
+
+    def _get_file_mtime(self) -> Optional[int]:
+        """Get config file modification time in nanoseconds (None if missing)"""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @property
+    def git_dir_path(self) -> str:
+        """Expanded git directory path"""
+        return self.expand_path(self.config.git_dir)
+
+    @property
+    def work_tree_path(self) -> str:
+        """Expanded work tree path"""
+        return self.expand_path(self.config.work_tree)
+
+    def expand_path(self, path: str) -> str:
+        """Expand a configured path once and reuse the result"""
+        expanded = self._expanded_paths.get(path)
+        if expanded is None:
+            expanded = os.path.expanduser(path)
+            self._expanded_paths[path] = expanded
+        return expanded
+
     def load_config(self) -> Config:
         """Load configuration from JSON file with validation and defaults"""
+        self._config_mtime = None
+
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return Config.from_dict(data)
-        except (json.JSONDecodeError, KeyError, TypeError):
-            # Return default configuration on any error
+            with open(self.config_path, 'rb') as f:
+                # Stat the open descriptor so mtime and content belong to the same file
+                self._config_mtime = os.fstat(f.fileno()).st_mtime_ns
+                data = _loads(f.read())
+                return Config.from_dict(data)
+        except (ValueError, KeyError, TypeError, OSError):
+            # Return default configuration on any error (ValueError covers JSON and UTF-8 errors)
             pass
 
         return Config()
@@ -40,12 +103,26 @@ class ConfigManager:
         if config is None:
             config = self.config
 
+        # Write to a temporary file and rename it over the original,
+        # so a crash mid-write never leaves a truncated config behind
+        tmp_path = f"{self.config_path}.tmp"
+
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=4, ensure_ascii=False)
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(config.to_dict()))
+                if self.durable_writes:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_path)
             self._config = config  # Update cached config
+            self._version += 1
+            self._config_mtime = self._get_file_mtime()
             return True
         except (IOError, OSError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
 
     def update_config(self, **kwargs) -> bool:
@@ -72,8 +149,8 @@ class ConfigManager:
         config = self.config
 
         # Expand paths for validation
-        git_dir = os.path.expanduser(config.git_dir)
-        work_tree = os.path.expanduser(config.work_tree)
+        git_dir = self.expand_path(config.git_dir)
+        work_tree = self.expand_path(config.work_tree)
 
         if not os.path.exists(work_tree):
             issues.append(f"Work tree path does not exist: {work_tree}")
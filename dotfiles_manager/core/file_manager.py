@@ -6,10 +6,58 @@ Handles file system operations and directory browsing.
 import os
 import shutil
 import stat
+import time
+import functools
+import codecs
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 
 from .config_manager import ConfigManager
-from ..common import Config, DirectoryItem, format_file_size, format_file_mtime
+from .ignore_spec import IgnoreSpec, spec_matches
+from ..common import Config, DirectoryItem, fast_copy2, format_file_size, format_file_mtime
+
+@functools.lru_cache(maxsize=128)
+def _expand(path: str) -> str:
+    """Cached user path expansion for repeatedly browsed directories"""
+    return os.path.expanduser(path)
+
+_Utf8Decoder = codecs.getincrementaldecoder('utf-8')
+
+# Once stat'ing a listing takes longer than this (cold cache, network mount),
+# the remaining entries are stat'ed concurrently
+SLOW_STAT_BUDGET = 0.05
+STAT_WORKERS = 16
+
+def _stat_entry(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """Stat a directory entry (following symlinks like os.stat), None if inaccessible"""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+def _stat_entries(entries: List[os.DirEntry]) -> List[Optional[os.stat_result]]:
+    """Stat entries in order - serially while fast, concurrently once the file system proves slow"""
+    results: List[Optional[os.stat_result]] = []
+    deadline = time.monotonic() + SLOW_STAT_BUDGET
+    for i, entry in enumerate(entries):
+        if len(entries) - i > 1 and time.monotonic() > deadline:
+            # Overlap the remaining stat latencies; threads only pay off when stats block
+            with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+                results.extend(executor.map(_stat_entry, entries[i:]))
+            break
+        results.append(_stat_entry(entry))
+    return results
+
+# File icons by extension
+DEFAULT_FILE_ICON = '📄'
+FILE_ICONS = {
+    '.py': '🐍', '.js': '📜', '.ts': '📘', '.json': '📋',
+    '.md': '📄', '.txt': '📄', '.yml': '⚙️', '.yaml': '⚙️',
+    '.ini': '⚙️', '.conf': '⚙️', '.cfg': '⚙️',
+    '.sh': '📜', '.bash': '📜', '.zsh': '📜',
+    '.png': '🖼️', '.jpg': '🖼️', '.jpeg': '🖼️', '.gif': '🖼️',
+    '.zip': '📦', '.tar': '📦', '.gz': '📦',
+}
 
 class FileManager:
     """Manages file system operations and directory browsing"""
@@ -17,15 +65,31 @@ class FileManager:
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
 
+        # Files that must never be touched (this module and the config file)
+        self._protected = frozenset({
+            os.path.abspath(__file__),
+            os.path.abspath(config_manager.config_path)
+        })
+
+        # Gitignore matcher for the current work tree, created on first listing
+        self._ignore_spec: Optional[IgnoreSpec] = None
+
     @property
     def config(self) -> Config:
         """Get current configuration"""
         return self.config_manager.config
 
+    def get_ignore_spec(self) -> IgnoreSpec:
+        """Get the gitignore matcher for the configured work tree"""
+        work_tree = os.path.abspath(self.config_manager.work_tree_path)
+        if self._ignore_spec is None or self._ignore_spec.work_tree != work_tree:
+            self._ignore_spec = IgnoreSpec(work_tree)
+        return self._ignore_spec
+
     def get_directory_contents(self, directory: str) -> List[DirectoryItem]:
         """Get contents of a directory for browsing"""
         items = []
-        directory = os.path.expanduser(directory)
+        directory = _expand(directory)
 
         try:
             # Add parent directory entry if not at root
@@ -37,41 +101,65 @@ class FileManager:
                     type="parent"
                 ))
 
-            # Get directory contents
+            # Get directory contents (single scandir batch, d_type cached per entry)
             try:
-                entries = os.listdir(directory)
+                with os.scandir(directory) as it:
+                    entries = list(it)
             except PermissionError:
                 return items  # Return just parent dir if can't read
 
             # Sort entries: directories first, then files
-            entries.sort(key=lambda x: (not os.path.isdir(os.path.join(directory, x)), x.lower()))
-
+            # DirEntry.is_dir only stats symlinks, regular entries use the cached d_type
+            entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
+
+            # Gitignored entries can never be added - they are listed without being stat'ed
+            ignored = set()
+            ignore_spec = self.get_ignore_spec()
+            work_tree = ignore_spec.work_tree
+            abs_directory = os.path.abspath(directory)
+            if abs_directory == work_tree or abs_directory.startswith(work_tree + os.sep):
+                # Check the ignore files once per listing, not once per entry
+                spec = ignore_spec.current()
+                if spec is not None:
+                    rel_dir = abs_directory[len(work_tree) + 1:]
+                    prefix = rel_dir + '/' if rel_dir else ''
+                    ignored = {
+                        e.name for e in entries
+                        if spec_matches(spec, prefix + e.name, e.is_dir())
+                    }
+
+            stat_results = iter(_stat_entries([e for e in entries if e.name not in ignored]))
             for entry in entries:
-                full_path = os.path.join(directory, entry)
-
-                try:
-                    stat_info = os.stat(full_path)
-                    is_dir = stat.S_ISDIR(stat_info.st_mode)
-                    is_hidden = entry.startswith('.')
-
-                    # Determine item type based on directory status and hidden status
-                    if is_dir:
-                        item_type = "hidden_directory" if is_hidden else "directory"
-                    else:
-                        item_type = "hidden_file" if is_hidden else "file"
-
+                if entry.name in ignored:
                     items.append(DirectoryItem(
-                        path=entry,
-                        full_path=full_path,
-                        type=item_type,
-                        size=stat_info.st_size if not is_dir else 0,
-                        mtime=stat_info.st_mtime
+                        path=entry.name,
+                        full_path=entry.path,
+                        type="ignored_directory" if entry.is_dir() else "ignored_file"
                     ))
+                    continue
 
-                except (OSError, IOError):
+                stat_info = next(stat_results)
+                if stat_info is None:
                     # Skip files we can't access
                     continue
 
+                is_dir = stat.S_ISDIR(stat_info.st_mode)
+                is_hidden = entry.name.startswith('.')
+
+                # Determine item type based on directory status and hidden status
+                if is_dir:
+                    item_type = "hidden_directory" if is_hidden else "directory"
+                else:
+                    item_type = "hidden_file" if is_hidden else "file"
+
+                items.append(DirectoryItem(
+                    path=entry.name,
+                    full_path=entry.path,
+                    type=item_type,
+                    size=stat_info.st_size if not is_dir else 0,
+                    mtime=stat_info.st_mtime
+                ))
+
         except (OSError, IOError):
             # Return empty list if directory is inaccessible
             pass
@@ -80,12 +168,7 @@ class FileManager:
 
     def is_protected_file(self, file_path: str) -> bool:
         """Check if file is protected from operations (like the script itself)"""
-        current_script = os.path.abspath(__file__)
-        config_file = os.path.abspath(self.config_manager.config_path)
-        abs_path = os.path.abspath(file_path)
-
-        protected_files = {current_script, config_file}
-        return abs_path in protected_files
+        return os.path.abspath(file_path) in self._protected
 
     def copy_file_to_dotfiles(self, source_path: str, target_base_dir: str) -> Optional[str]:
         """Copy a file to dotfiles directory, preserving relative structure"""
@@ -104,14 +187,14 @@ class FileManager:
         try:
             # Create target directory if needed
             target_dir = os.path.dirname(target_path)
-            if target_dir and not os.path.exists(target_dir):
-                os.makedirs(target_dir)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
 
-            # Copy file
+            # Copy file (in-kernel copy_file_range where supported, sendfile otherwise)
             if os.path.isdir(source_path):
-                shutil.copytree(source_path, target_path, dirs_exist_ok=True)
+                shutil.copytree(source_path, target_path, copy_function=fast_copy2, dirs_exist_ok=True)
             else:
-                shutil.copy2(source_path, target_path)
+                fast_copy2(source_path, target_path)
 
             return target_path
 
@@ -136,9 +219,14 @@ class FileManager:
             if b'\x00' in chunk:
                 return False
 
-            # Try to decode as UTF-8
+            # Pure ASCII is the common case for dotfiles - single C-level scan
+            if chunk.isascii():
+                return True
+
+            # Validate as UTF-8 without keeping the decoded text;
+            # a multi-byte character cut at the chunk boundary is not an error
             try:
-                chunk.decode('utf-8')
+                _Utf8Decoder().decode(chunk, final=False)
                 return True
             except UnicodeDecodeError:
                 return False
@@ -154,23 +242,13 @@ class FileManager:
             return "📂"
         else:
             # Determine icon based on file extension
-            _, ext = os.path.splitext(item.path.lower())
-
-            icon_map = {
-                '.py': '🐍', '.js': '📜', '.ts': '📘', '.json': '📋',
-                '.md': '📄', '.txt': '📄', '.yml': '⚙️', '.yaml': '⚙️',
-                '.ini': '⚙️', '.conf': '⚙️', '.cfg': '⚙️',
-                '.sh': '📜', '.bash': '📜', '.zsh': '📜',
-                '.png': '🖼️', '.jpg': '🖼️', '.jpeg': '🖼️', '.gif': '🖼️',
-                '.zip': '📦', '.tar': '📦', '.gz': '📦',
-            }
-
-            return icon_map.get(ext, '📄')
+            ext = os.path.splitext(item.path)[1].lower()
+            return FILE_ICONS.get(ext, DEFAULT_FILE_ICON)
 
     def validate_file_path(self, file_path: str) -> Tuple[bool, str]:
         """Validate file path and return (is_valid, error_message)"""
         try:
-            expanded_path = os.path.expanduser(file_path)
+            expanded_path = _expand(file_path)
 
             if not os.path.exists(expanded_path):
                 return False, "Path does not exist"
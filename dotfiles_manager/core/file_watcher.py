@@ -0,0 +1,238 @@
+"""
+File Watcher
+Watches the tracked files' directories so git status is only re-queried when needed.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Optional dependency - without it the app falls back to always refreshing
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Git dir files whose replacement means the status changed (index for add/reset, HEAD and
+# refs for commits, checkouts and pulls)
+GIT_STATE_FILES = ('index', 'HEAD', 'packed-refs')
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Forwards filesystem events to the watcher"""
+
+    def __init__(self, watcher: 'FileWatcher'):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        # Directory mtime updates duplicate the events of the files inside them
+        if event.is_directory and event.event_type == 'modified':
+            return
+
+        self.watcher._on_event(event.src_path, event.is_directory)
+        dest_path = getattr(event, 'dest_path', '')
+        if dest_path:
+            self.watcher._on_event(dest_path, event.is_directory)
+
+class FileWatcher:
+    """Debounced filesystem watcher for the tracked files of the dotfiles work tree"""
+
+    def __init__(self, work_tree: str, git_dir: str, tracked_paths: Callable[[], Iterable[str]], debounce: float = 0.3):
+        self.work_tree = os.path.abspath(work_tree)
+        self.git_dir = os.path.abspath(git_dir)
+        self.tracked_paths = tracked_paths
+        self.debounce = debounce
+
+        self._changed = threading.Event()
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+        self._observer = None
+        self._stopped = False
+
+        # Only directories holding tracked files get a non-recursive watch - the work tree is
+        # usually $HOME, where a recursive watch walks everything and uses up inotify watches
+        self._watches: Dict[str, object] = {}
+        # Absolute tracked paths and watched directories, replaced as a whole for the event thread
+        self._tracked: FrozenSet[str] = frozenset()
+        self._directories: FrozenSet[str] = frozenset()
+        self._sync_lock = threading.Lock()
+        self._sync_thread: Optional[threading.Thread] = None
+
+        # Identities of GIT_STATE_FILES and the current branch ref at the last check
+        self._git_state: Optional[Tuple] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the watcher is active (False until the background start has finished)"""
+        return self._observer is not None
+
+    def start(self) -> bool:
+        """Start watching in the background, returns False if unavailable"""
+        if not WATCHDOG_AVAILABLE or not os.path.isdir(self.work_tree):
+            return False
+
+        if self._sync_thread is None:
+            self._git_state = self._read_git_state()
+            self._sync_thread = threading.Thread(target=self._start_observer, name="file-watcher", daemon=True)
+            self._sync_thread.start()
+        return True
+
+    def stop(self):
+        """Stop watching and cancel any pending notification"""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        with self._sync_lock:
+            self._stopped = True
+            observer = self._observer
+            self._observer = None
+
+        if observer is not None:
+            try:
+                observer.stop()
+                observer.join(timeout=1.0)
+            except RuntimeError:
+                pass
+
+    def consume_changes(self) -> bool:
+        """Return True if tracked files or the index/HEAD changed since the last call (always True when not running)"""
+        if not self.is_running:
+            return True
+
+        changed = self._changed.is_set()
+        self._changed.clear()
+
+        # Commits, adds and pulls from another shell only touch the git dir, which is not watched
+        git_state = self._read_git_state()
+        if git_state != self._git_state:
+            self._git_state = git_state
+            changed = True
+            # Files may have been added to or removed from the index
+            self._resync_async()
+
+        return changed
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Check if an event path should not trigger a refresh"""
+        abs_path = os.path.abspath(path)
+        if abs_path in self._tracked:
+            return False
+
+        # A removed or renamed directory may have held tracked files
+        if is_dir:
+            prefix = abs_path + os.sep
+            return not any(directory == abs_path or directory.startswith(prefix) for directory in self._directories)
+
+        # Untracked files never show up in the status (showUntrackedFiles=no)
+        return True
+
+    def _start_observer(self):
+        """Background start: set up the observer and its watches off the UI thread"""
+        observer = Observer()
+        observer.daemon = True
+        try:
+            observer.start()
+            self._sync_watches(observer)
+        except (OSError, RuntimeError):
+            # Out of inotify watches, permission denied, etc. - keep refreshing on every view
+            observer.stop()
+            return
+
+        with self._sync_lock:
+            if not self._stopped:
+                self._observer = observer
+                return
+
+        # Stopped while starting
+        observer.stop()
+
+    def _resync_async(self):
+        """Re-sync the watched directories in the background unless a sync is running"""
+        with self._sync_lock:
+            if self._stopped or (self._sync_thread is not None and self._sync_thread.is_alive()):
+                return
+            observer = self._observer
+            thread = threading.Thread(target=self._sync_watches, args=(observer,), name="file-watcher", daemon=True)
+            self._sync_thread = thread
+        thread.start()
+
+    def _sync_watches(self, observer):
+        """Watch exactly the directories that contain tracked files"""
+        try:
+            rel_paths = list(self.tracked_paths())
+        except Exception:
+            # Repository missing or unreadable - keep the current watches
+            return
+
+        tracked = frozenset(os.path.join(self.work_tree, os.path.normpath(rel_path)) for rel_path in rel_paths)
+        directories = {os.path.dirname(path) for path in tracked}
+
+        handler = None
+        with self._sync_lock:
+            if self._stopped:
+                return
+
+            for directory in list(self._watches):
+                if directory not in directories:
+                    try:
+                        observer.unschedule(self._watches.pop(directory))
+                    except (KeyError, OSError):
+                        pass
+
+            for directory in directories:
+                if directory in self._watches or not os.path.isdir(directory):
+                    continue
+                if handler is None:
+                    handler = _ChangeHandler(self)
+                try:
+                    self._watches[directory] = observer.schedule(handler, directory, recursive=False)
+                except OSError:
+                    # Unreadable directory or out of watches - its files fall back to max_age
+                    continue
+
+            self._tracked = tracked
+            self._directories = frozenset(self._watches)
+
+    def _read_git_state(self) -> Tuple:
+        """Identities of the git dir files that change with commits, adds and checkouts"""
+        state = []
+        for name in GIT_STATE_FILES:
+            state.append(self._get_identity(os.path.join(self.git_dir, name)))
+
+        # The branch ref HEAD points to moves on every commit while HEAD itself stays put
+        try:
+            with open(os.path.join(self.git_dir, 'HEAD'), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            head = ''
+        if head.startswith('ref: '):
+            state.append(self._get_identity(os.path.join(self.git_dir, head[5:])))
+
+        return tuple(state)
+
+    @staticmethod
+    def _get_identity(path: str) -> Optional[Tuple[int, int, int]]:
+        """Get (inode, mtime in nanoseconds, size) of a file, None if it is missing"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _on_event(self, path: str, is_dir: bool = False):
+        """Handle a raw filesystem event with debouncing"""
+        if not path or self.is_ignored(path, is_dir):
+            return
+
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._changed.set)
+            self._timer.daemon = True
+            self._timer.start()
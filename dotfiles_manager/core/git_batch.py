@@ -0,0 +1,99 @@
+"""
+Git Batch Check
+Long-lived `git cat-file --batch-check` process for cheap object lookups.
+"""
+
+import atexit
+import subprocess
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+# Open helpers, closed at interpreter exit (weak so unused managers can be collected)
+_open_helpers: "weakref.WeakSet[GitBatchCheck]" = weakref.WeakSet()
+
+def _close_open_helpers():
+    """Terminate all batch processes still running"""
+    for helper in list(_open_helpers):
+        helper.close()
+
+atexit.register(_close_open_helpers)
+
+class GitBatchCheck:
+    """Answers object lookups through one persistent git process instead of one spawn per query"""
+
+    def __init__(self, git_command_base: List[str], cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None):
+        self.git_command_base = list(git_command_base)
+        self.cwd = cwd
+        self.env = env
+
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def lookup(self, name: str) -> Optional[Tuple[str, str]]:
+        """Resolve a revision to (object id, type), None if missing; raises OSError if git fails"""
+        if '\n' in name:
+            raise ValueError("Object names cannot contain newlines")
+
+        with self._lock:
+            process = self._ensure_process()
+            try:
+                process.stdin.write(f"{name}\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except (OSError, ValueError) as e:
+                self._kill()
+                raise OSError(f"git cat-file failed: {e}") from e
+
+            if not line:
+                self._kill()
+                raise OSError("git cat-file exited unexpectedly")
+
+        # "<name> missing" / "<name> ambiguous" echo the name, which may contain spaces
+        line = line.rstrip('\n')
+        if line.endswith((' missing', ' ambiguous')):
+            return None
+
+        object_id, _, object_type = line.partition(' ')
+        return object_id, object_type
+
+    def exists(self, name: str) -> bool:
+        """Check if a revision resolves to an object"""
+        return self.lookup(name) is not None
+
+    def close(self):
+        """Stop the git process"""
+        with self._lock:
+            self._kill()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        """Start the batch process on first use or after it died"""
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                self.git_command_base + ['cat-file', '--batch-check=%(objectname) %(objecttype)'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                cwd=self.cwd,
+                env=self.env
+            )
+            _open_helpers.add(self)
+        return self._process
+
+    def _kill(self):
+        """Close pipes and reap the process"""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        try:
+            process.stdin.close()
+            process.wait(timeout=1.0)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            if process.stdout:
+                process.stdout.close()
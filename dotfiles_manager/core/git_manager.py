@@ -4,14 +4,168 @@ Handles all Git operations for the dotfiles repository.
 """
 
 import os
+import re
+import copy
+import functools
 import subprocess
-import stat
 import shutil
+import stat
+import sys
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from operator import itemgetter
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Callable, Iterator
 
 from .config_manager import ConfigManager
-from ..common import Config, FileInfo, GitChange
+from .git_batch import GitBatchCheck
+from .ignore_spec import DEFAULT_GITIGNORE
+from ..common import Config, FileInfo, GitChange, fast_copy2
+
+# Background push threads still running; joined at interpreter exit so a push is never cut off
+_pending_pushes: List[threading.Thread] = []
+_pending_pushes_lock = threading.Lock()
+
+def _join_pending_pushes():
+    """Wait for outstanding background pushes to finish"""
+    with _pending_pushes_lock:
+        threads = list(_pending_pushes)
+    for thread in threads:
+        thread.join()
+
+atexit.register(_join_pending_pushes)
+
+# Pull errors meaning local files would be overwritten (matched case-insensitively in one pass)
+_OVERWRITE_KEYWORDS = (
+    "sarebbero sovrascritti dal merge",
+    "would be overwritten by merge",
+    "would be overwritten by checkout",
+    "untracked working tree files would be overwritten",
+)
+_OVERWRITE_RE = re.compile('|'.join(map(re.escape, _OVERWRITE_KEYWORDS)), re.IGNORECASE)
+_NO_TRACKING_RE = re.compile("no tracking information", re.IGNORECASE)
+
+# Index mode of submodule entries, the only tracked entries that are directories
+GITLINK_MODE = '160000'
+
+# Limits for paths passed to a single git invocation (well below ARG_MAX)
+GIT_BATCH_MAX_PATHS = 1000
+GIT_BATCH_MAX_BYTES = 100_000
+
+def _chunk_paths(items: List[Any], key: Callable[[Any], str] = str) -> Iterator[List[Any]]:
+    """Split items into command-line sized chunks by path count and total length"""
+    chunk = []
+    chunk_bytes = 0
+
+    for item in items:
+        item_bytes = len(os.fsencode(key(item))) + 1
+        if chunk and (len(chunk) >= GIT_BATCH_MAX_PATHS or chunk_bytes + item_bytes > GIT_BATCH_MAX_BYTES):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(item)
+        chunk_bytes += item_bytes
+
+    if chunk:
+        yield chunk
+
+# Porcelain status letters and their descriptions
+_STATUS_MAP = {
+    'A': 'Added', 'M': 'Modified', 'D': 'Deleted', 'R': 'Renamed',
+    'C': 'Copied', 'U': 'Updated', '?': 'Untracked', '!': 'Ignored'
+}
+_STATUS_GET = _STATUS_MAP.get
+
+# Staged status letters summarized in generated commit messages, in message order
+_COMMIT_VERBS = {'A': 'add', 'M': 'update', 'D': 'remove', 'R': 'rename'}
+
+def _decode_output(output: Optional[bytes]) -> Optional[str]:
+    """Decode git output like file names (undecodable bytes survive as surrogates)"""
+    if not output:
+        return "" if output is not None else None
+    return os.fsdecode(output)
+
+def _parse_porcelain_z(output: str) -> Iterator[Tuple[str, str, str]]:
+    """Yield (staged, worktree, path) from `git status --porcelain -z` output"""
+    records = iter(output.split('\0'))
+    for record in records:
+        # Fixed width "XY path", no quoting or stripping needed with -z
+        if len(record) < 4:
+            continue
+
+        x, y = record[0], record[1]
+        yield ('' if x == ' ' else x), ('' if y == ' ' else y), record[3:]
+
+        # Renames and copies are followed by the original path
+        if x in 'RC' or y in 'RC':
+            next(records, None)
+
+def _parse_backup_timestamp(name: str) -> datetime:
+    """Parse a fixed-width YYYYMMDD_HHMMSS backup name, raises ValueError if it is not one"""
+    digits = name[:8] + name[9:]
+    if len(name) != 15 or name[8] != '_' or not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"Not a backup timestamp: {name}")
+
+    return datetime(
+        int(name[0:4]), int(name[4:6]), int(name[6:8]),
+        int(name[9:11]), int(name[11:13]), int(name[13:15])
+    )
+
+def _scan_size_and_count(path: str) -> Tuple[int, int]:
+    """Total size and number of files below path, reusing scandir's cached entry data"""
+    total_size = 0
+    file_count = 0
+
+    # Explicit LIFO stack instead of recursion: no recursion limit, memory O(depth)
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return total_size, file_count
+
+# Backups are never modified after creation, so their totals are scanned once
+# per process, keyed by path and directory mtime (a recreated backup rescans)
+_backup_totals: Dict[str, Tuple[int, Tuple[int, int]]] = {}
+
+def _backup_size_and_count(path: str) -> Tuple[int, int]:
+    """Cached _scan_size_and_count for backup directories"""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0, 0
+
+    cached = _backup_totals.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    totals = _scan_size_and_count(path)
+    _backup_totals[path] = (mtime, totals)
+    return totals
+
+def require_repo(default: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator for GitManager methods: return a copy of default when no repository is initialized"""
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self: 'GitManager', *args, **kwargs):
+            if not self.is_git_repo_initialized():
+                # Copy so callers never share a mutable default
+                return copy.deepcopy(default)
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
 
 class GitManager:
     """Manages all Git operations for the dotfiles repository"""
@@ -19,6 +173,35 @@ class GitManager:
     def __init__(self, config_manager: ConfigManager):
         self.config_manager = config_manager
 
+        # Environment for git processes, built once: C locale skips message catalog
+        # loading and keeps stderr in the English the error checks look for
+        self._git_env = {**os.environ, 'LC_ALL': 'C'}
+
+        # Absolute git executable, resolved once so each spawn skips the PATH search
+        self._git_exe = shutil.which('git') or 'git'
+
+        # Base git command, rebuilt only when the config version changes
+        self._command_base: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+        # Cached repository check as (git dir, git dir identity, initialized)
+        self._repo_state: Optional[Tuple[str, Optional[Tuple[int, int]], bool]] = None
+
+        # Git dir known to have commits; a missing HEAD is never cached since the
+        # first commit may be made outside the app
+        self._head_state: Optional[str] = None
+
+        # Background warm-up of the caches below, see start_prefetch
+        self._prefetch: Optional[threading.Thread] = None
+
+        # Persistent cat-file process for read-only lookups, started on first use
+        self._batch_check: Optional[GitBatchCheck] = None
+
+        # Tracked paths as (git dir, index identity, paths), re-read when the index file changes
+        self._tracked_set: Optional[Tuple[str, Optional[Tuple[int, int, int]], FrozenSet[str]]] = None
+
+        # Local config as (git dir, config file identity, entries), re-read when the file changes
+        self._local_config: Optional[Tuple[str, Optional[Tuple[int, int, int]], Dict[str, str]]] = None
+
     @property
     def config(self) -> Config:
         """Get current configuration"""
@@ -27,7 +210,7 @@ class GitManager:
     def create_backup_before_pull(self) -> Optional[str]:
         """Create backup of files that would be overwritten by pull"""
         try:
-            work_tree = os.path.expanduser(self.config.work_tree)
+            work_tree = self.config_manager.work_tree_path
 
             # First try to fetch latest changes to compare
             self.run_git_command(['fetch', 'origin', 'main'])
@@ -35,17 +218,10 @@ class GitManager:
             files_to_backup = []
 
             # Get list of all files that will come from origin/main
-            success, stdout, _ = self.run_git_command(['ls-tree', '-r', '--name-only', 'origin/main'])
-            if success:
-                for line in stdout.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    file_path = os.path.join(work_tree, line)
-                    # If file exists locally, it might be overwritten
-                    if os.path.exists(file_path):
-                        files_to_backup.append(line)
+            for name in self.run_git_stream(['ls-tree', '-r', '-z', '--name-only', 'origin/main']):
+                # If file exists locally, it might be overwritten
+                if os.path.exists(os.path.join(work_tree, name)):
+                    files_to_backup.append(name)
 
             if not files_to_backup:
                 return None
@@ -55,22 +231,36 @@ class GitManager:
             backup_dir = os.path.join(work_tree, '.config', 'dotfiles-manager', 'backup', backup_timestamp)
             os.makedirs(backup_dir, exist_ok=True)
 
-            # Copy files to backup
-            backed_up_files = []
-            for file_rel_path in files_to_backup:
-                source_path = os.path.join(work_tree, file_rel_path)
-                backup_path = os.path.join(backup_dir, file_rel_path)
-
-                # Create subdirectories if needed
-                backup_file_dir = os.path.dirname(backup_path)
-                if backup_file_dir:
+            # Create every backup subdirectory up front so workers only copy. Sorting by
+            # components puts descendants right after their ancestor, and makedirs on the
+            # deepest directory of each chain creates the rest of it
+            backup_dirs = sorted(
+                {os.path.dirname(os.path.join(backup_dir, f)) for f in files_to_backup},
+                key=lambda d: d.split(os.sep)
+            )
+            for i, backup_file_dir in enumerate(backup_dirs):
+                next_dir = backup_dirs[i + 1] if i + 1 < len(backup_dirs) else ''
+                if next_dir.startswith(backup_file_dir + os.sep):
+                    continue
+                try:
                     os.makedirs(backup_file_dir, exist_ok=True)
+                except OSError:
+                    pass  # Reported by the copies that need it
 
-                try:
-                    shutil.copy2(source_path, backup_path)
-                    backed_up_files.append(file_rel_path)
-                except (OSError, IOError) as e:
-                    print(f"Warning: Could not backup {file_rel_path}: {e}")
+            def backup_file(file_rel_path: str):
+                fast_copy2(os.path.join(work_tree, file_rel_path), os.path.join(backup_dir, file_rel_path))
+
+            # Copy files to backup - independent I/O bound copies run concurrently
+            backed_up_files = []
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                futures = {executor.submit(backup_file, f): f for f in files_to_backup}
+                for future in as_completed(futures):
+                    file_rel_path = futures[future]
+                    try:
+                        future.result()
+                        backed_up_files.append(file_rel_path)
+                    except (OSError, IOError) as e:
+                        print(f"Warning: Could not backup {file_rel_path}: {e}")
 
             if backed_up_files:
                 print(f"Created backup of {len(backed_up_files)} files in {backup_dir}")
@@ -84,7 +274,7 @@ class GitManager:
     def get_backup_directories(self) -> List[Dict[str, Any]]:
         """Get list of all backup directories with metadata"""
         try:
-            work_tree = os.path.expanduser(self.config.work_tree)
+            work_tree = self.config_manager.work_tree_path
             backup_base_dir = os.path.join(work_tree, '.config', 'dotfiles-manager', 'backup')
 
             if not os.path.exists(backup_base_dir):
@@ -96,19 +286,10 @@ class GitManager:
                 if os.path.isdir(backup_path):
                     try:
                         # Parse timestamp from directory name (YYYYMMDD_HHMMSS)
-                        timestamp_str = item
-                        timestamp_obj = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
+                        timestamp_obj = _parse_backup_timestamp(item)
 
                         # Get directory size and file count
-                        total_size = 0
-                        file_count = 0
-                        for root, dirs, files in os.walk(backup_path):
-                            file_count += len(files)
-                            for file in files:
-                                try:
-                                    total_size += os.path.getsize(os.path.join(root, file))
-                                except OSError:
-                                    pass
+                        total_size, file_count = _backup_size_and_count(backup_path)
 
                         backups.append({
                             'name': item,
@@ -122,7 +303,7 @@ class GitManager:
                         continue
 
             # Sort by timestamp (newest first)
-            backups.sort(key=lambda x: x['timestamp'], reverse=True)
+            backups.sort(key=itemgetter('timestamp'), reverse=True)
             return backups
 
         except Exception as e:
@@ -132,11 +313,12 @@ class GitManager:
     def delete_backup(self, backup_name: str) -> bool:
         """Delete a specific backup directory"""
         try:
-            work_tree = os.path.expanduser(self.config.work_tree)
+            work_tree = self.config_manager.work_tree_path
             backup_path = os.path.join(work_tree, '.config', 'dotfiles-manager', 'backup', backup_name)
 
             if os.path.exists(backup_path):
                 shutil.rmtree(backup_path)
+                _backup_totals.pop(backup_path, None)
                 return True
             return False
         except Exception as e:
@@ -145,41 +327,191 @@ class GitManager:
 
     def get_git_command_base(self) -> List[str]:
         """Get base git command with proper git-dir and work-tree"""
-        config = self.config
-        git_dir = os.path.expanduser(config.git_dir)
-        work_tree = os.path.expanduser(config.work_tree)
-
-        return [
-            'git',
-            f'--git-dir={git_dir}',
-            f'--work-tree={work_tree}'
-        ]
-
-    def run_git_command(self, args: List[str], capture_output: bool = True) -> Tuple[bool, str, str]:
-        """Run git command and return success, stdout, stderr"""
+        version = self.config_manager.version
+        if self._command_base is None or self._command_base[0] != version:
+            git_dir = self.config_manager.git_dir_path
+            work_tree = self.config_manager.work_tree_path
+            self._command_base = (version, (
+                self._git_exe,
+                f'--git-dir={git_dir}',
+                f'--work-tree={work_tree}'
+            ))
+
+        return list(self._command_base[1])
+
+    def run_git_command(self, args: List[str], capture_output: bool = True, input_data: Optional[bytes] = None) -> Tuple[bool, str, str]:
+        """Run git command and return success, stdout, stderr (input_data is fed to stdin)"""
         command = self.get_git_command_base() + args
 
         try:
+            # Capture raw bytes and decode only what was actually written; most commands
+            # called for their exit status print nothing
             result = subprocess.run(
                 command,
                 capture_output=capture_output,
-                text=True,
-                cwd=os.path.expanduser(self.config.work_tree)
+                input=input_data,
+                cwd=self.config_manager.work_tree_path,
+                env=self._git_env
             )
-            return result.returncode == 0, result.stdout, result.stderr
+            return result.returncode == 0, _decode_output(result.stdout), _decode_output(result.stderr)
         except subprocess.SubprocessError as e:
             return False, "", str(e)
 
+    def start_prefetch(self):
+        """Load the local config and HEAD state in the background while the UI starts"""
+        if self._prefetch is None:
+            self._prefetch = threading.Thread(target=self._prefetch_git_state, name="git-prefetch", daemon=True)
+            self._prefetch.start()
+
+    def _prefetch_git_state(self):
+        """Prefetch thread: fill the config and HEAD caches"""
+        try:
+            if self.is_git_repo_initialized():
+                self.get_local_config()
+                self.has_commits()
+        except Exception:
+            # Readers simply load the state themselves
+            pass
+
+    def _wait_for_prefetch(self):
+        """Let a running prefetch finish before touching the caches it fills"""
+        prefetch = self._prefetch
+        if prefetch is not None and prefetch is not threading.current_thread():
+            prefetch.join()
+
+    def get_batch_check(self) -> GitBatchCheck:
+        """Get the persistent lookup process for the current git dir and work tree"""
+        self._wait_for_prefetch()
+        command_base = self.get_git_command_base()
+        batch_check = self._batch_check
+        if batch_check is None or batch_check.git_command_base != command_base:
+            # Repository paths changed in settings - replace the old process
+            if batch_check is not None:
+                batch_check.close()
+            batch_check = GitBatchCheck(command_base, cwd=self.config_manager.work_tree_path, env=self._git_env)
+            self._batch_check = batch_check
+        return batch_check
+
+    def has_commits(self) -> bool:
+        """Check if HEAD points to a commit (only a positive answer is cached)"""
+        self._wait_for_prefetch()
+        git_dir = self.config_manager.git_dir_path
+        if self._head_state == git_dir:
+            return True
+
+        try:
+            has_commits = self.get_batch_check().exists('HEAD')
+        except OSError:
+            has_commits, _, _ = self.run_git_command(['rev-parse', '--verify', '--quiet', 'HEAD'])
+
+        if has_commits:
+            self._head_state = git_dir
+        return has_commits
+
+    def close(self):
+        """Stop background git processes"""
+        if self._batch_check is not None:
+            self._batch_check.close()
+            self._batch_check = None
+
+    @staticmethod
+    def _to_rel(file_path: str, work_tree: str) -> str:
+        """Path relative to the work tree by prefix slicing (paths outside it are returned unchanged)"""
+        if file_path == work_tree:
+            return '.'
+
+        prefix = work_tree.rstrip(os.sep) + os.sep
+        if file_path.startswith(prefix):
+            return file_path[len(prefix):]
+        return file_path
+
+    def run_git_stream(self, args: List[str], separator: bytes = b'\0') -> Iterator[str]:
+        """Run git command and yield its output records as they arrive (nothing on failure)"""
+        command = self.get_git_command_base() + args
+
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.config_manager.work_tree_path,
+                env=self._git_env
+            )
+        except (OSError, subprocess.SubprocessError):
+            return
+
+        try:
+            pending = b''
+            for block in iter(lambda: process.stdout.read(65536), b''):
+                records = (pending + block).split(separator)
+                pending = records.pop()
+                for record in records:
+                    if record:
+                        yield os.fsdecode(record)
+            if pending:
+                yield os.fsdecode(pending)
+        finally:
+            # Stop git if the caller stopped iterating early
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+    def run_git_command_chunked(self, args: List[str], paths: List[str]) -> bool:
+        """Run a git command over many paths in as few invocations as possible"""
+        chunks = list(_chunk_paths(paths))
+        if len(chunks) > 1:
+            # Too long for one command line - pass the paths on stdin instead, so git runs
+            # once and writes the index once (reset and rm support this since git 2.26)
+            success, _, _ = self.run_git_command(
+                args + ['--pathspec-from-file=-', '--pathspec-file-nul'],
+                input_data=b'\0'.join(os.fsencode(path) for path in paths)
+            )
+            if success:
+                return True
+
+        success = True
+        for chunk in chunks:
+            chunk_success, _, _ = self.run_git_command(args + ['--'] + chunk)
+            success = success and chunk_success
+        return success
+
     def is_git_repo_initialized(self) -> bool:
-        """Check if git repository is initialized"""
-        git_dir = os.path.expanduser(self.config.git_dir)
-        return os.path.isdir(git_dir) and os.path.exists(os.path.join(git_dir, 'HEAD'))
+        """Check if git repository is initialized (re-probed only when the git dir changes)"""
+        git_dir = self.config_manager.git_dir_path
+        git_dir_id = self._get_dir_identity(git_dir)
+
+        state = self._repo_state
+        if state is not None and state[0] == git_dir and state[1] == git_dir_id:
+            return state[2]
+
+        initialized = git_dir_id is not None and os.path.exists(os.path.join(git_dir, 'HEAD'))
+        self._repo_state = (git_dir, git_dir_id, initialized)
+        return initialized
+
+    @staticmethod
+    def _get_dir_identity(path: str) -> Optional[Tuple[int, int]]:
+        """Get (inode, mtime in nanoseconds) of a directory, None if it is missing"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        # Creating or removing HEAD (or recreating the directory) changes one of these
+        return (st.st_ino, st.st_mtime_ns) if stat.S_ISDIR(st.st_mode) else None
+
+    def invalidate_repo_state(self):
+        """Forget the cached repository and HEAD checks and lookup process after the repository changed"""
+        self._repo_state = None
+        self._head_state = None
+        self.close()
 
     def initialize_git_repo(self) -> bool:
         """Initialize bare git repository with complete configuration"""
         config = self.config
-        git_dir = os.path.expanduser(config.git_dir)
-        work_tree = os.path.expanduser(config.work_tree)
+        git_dir = self.config_manager.git_dir_path
+        work_tree = self.config_manager.work_tree_path
+
+        self.invalidate_repo_state()
 
         try:
             # Remove existing git directory if it exists
@@ -191,17 +523,18 @@ class GitManager:
 
             # Initialize bare repository using standard git init --bare command
             result = subprocess.run(
-                ['git', 'init', '--bare', git_dir],
+                [self._git_exe, 'init', '--bare', git_dir],
                 capture_output=True,
                 text=True,
-                cwd=work_tree
+                cwd=work_tree,
+                env=self._git_env
             )
             if result.returncode != 0:
                 return False
 
             # Create gitignore directory structure
-            gitignore_dir = os.path.expanduser('~/.config/dotfiles-manager')
-            gitignore_path = os.path.join(gitignore_dir, '.gitignore')
+            gitignore_path = self.config_manager.expand_path(DEFAULT_GITIGNORE)
+            gitignore_dir = os.path.dirname(gitignore_path)
 
             # Create .config/dotfiles-manager directory if it doesn't exist
             os.makedirs(gitignore_dir, exist_ok=True)
@@ -234,14 +567,22 @@ __pycache__/
 
             # Set up essential git configuration for bare repository using direct git commands
             git_config_commands = [
-                (['git', '-C', git_dir, 'config', 'status.showUntrackedFiles', 'no'], "Hide untracked files"),
-                (['git', '-C', git_dir, 'config', 'core.worktree', work_tree], "Configure work tree"),
-                (['git', '-C', git_dir, 'config', 'core.excludesfile', gitignore_path], "Configure global gitignore"),
-                (['git', '-C', git_dir, 'config', 'advice.addIgnoredFile', 'false'], "Disable ignored file warnings")
+                ([self._git_exe, '-C', git_dir, 'config', 'status.showUntrackedFiles', 'no'], "Hide untracked files"),
+                ([self._git_exe, '-C', git_dir, 'config', 'core.worktree', work_tree], "Configure work tree"),
+                ([self._git_exe, '-C', git_dir, 'config', 'core.excludesfile', gitignore_path], "Configure global gitignore"),
+                ([self._git_exe, '-C', git_dir, 'config', 'advice.addIgnoredFile', 'false'], "Disable ignored file warnings"),
+                ([self._git_exe, '-C', git_dir, 'config', 'feature.manyFiles', 'true'], "Enable large work tree optimizations"),
+                ([self._git_exe, '-C', git_dir, 'config', 'core.untrackedCache', 'true'], "Enable untracked cache")
             ]
 
+            # Built-in fsmonitor daemon is only available on some platforms (macOS, Windows)
+            if self._supports_fsmonitor():
+                git_config_commands.append(
+                    ([self._git_exe, '-C', git_dir, 'config', 'core.fsmonitor', 'true'], "Enable filesystem monitor")
+                )
+
             for cmd_args, description in git_config_commands:
-                result = subprocess.run(cmd_args, capture_output=True, text=True)
+                result = subprocess.run(cmd_args, capture_output=True, text=True, env=self._git_env)
                 if result.returncode != 0:
                     print(f"Warning: Failed to {description}: {result.stderr}")
 
@@ -252,28 +593,37 @@ __pycache__/
                     print(f"Warning: Failed to add remote origin")
                 else:
                     # Set upstream for main branch if remote was added successfully
-                    self._setup_upstream_tracking()
+                    # (a freshly initialized repository has no commits)
+                    self._setup_upstream_tracking(has_commits=False)
 
+            self._repo_state = (git_dir, self._get_dir_identity(git_dir), True)
             return True
 
         except Exception as e:
             print(f"Error during git repository initialization: {e}")
             return False
 
+    def _supports_fsmonitor(self) -> bool:
+        """Check if git's built-in fsmonitor daemon can watch this repository"""
+        # The daemon is only implemented for macOS and Windows - skip the probe elsewhere
+        if sys.platform not in ('darwin', 'win32'):
+            return False
+
+        _, stdout, stderr = self.run_git_command(['fsmonitor--daemon', 'status'])
+        output = (stdout + stderr).lower()
+
+        unsupported_markers = ["not supported", "incompatible", "not a git"]
+        return not any(marker in output for marker in unsupported_markers)
+
+    @require_repo(None)
     def get_file_git_info(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Get git information for a specific file"""
-        if not self.is_git_repo_initialized():
-            return None
-
         # Make path relative to work tree
-        work_tree = os.path.expanduser(self.config.work_tree)
-        if file_path.startswith(work_tree):
-            rel_path = os.path.relpath(file_path, work_tree)
-        else:
-            rel_path = file_path
+        work_tree = self.config_manager.work_tree_path
+        rel_path = self._to_rel(file_path, work_tree)
 
         # Get file status
-        success, stdout, _ = self.run_git_command(['status', '--porcelain', '--', rel_path])
+        success, stdout, _ = self.run_git_command(['--no-optional-locks', 'status', '--porcelain', '--', rel_path])
         if not success:
             return None
 
@@ -293,114 +643,132 @@ __pycache__/
 
         return status_info
 
+    @require_repo([])
     def get_tracked_files_info(self) -> List[FileInfo]:
         """Get information about all tracked files"""
-        if not self.is_git_repo_initialized():
-            return []
+        work_tree = self.config_manager.work_tree_path
 
-        files_info = []
-        work_tree = os.path.expanduser(self.config.work_tree)
-
-        # Get list of tracked files
-        success, stdout, _ = self.run_git_command(['ls-files'])
-        if not success:
-            return []
+        # Status of every changed tracked file from a single scan
+        statuses = self.get_tracked_statuses()
 
-        tracked_files = [line.strip() for line in stdout.split('\n') if line.strip()]
+        # Stream tracked files with their index mode ("mode object stage\tpath", NUL separated),
+        # stat'ing each while git is still writing the rest; conflicted paths repeat once per stage
+        files_info = []
+        previous_path = None
+        for record in self.run_git_stream(['ls-files', '-s', '-z']):
+            meta, _, rel_path = record.partition('\t')
+            if not rel_path or rel_path == previous_path:
+                continue
+            previous_path = rel_path
 
-        for rel_path in tracked_files:
-            full_path = os.path.join(work_tree, rel_path)
+            mode = meta.partition(' ')[0]
+            status = statuses.get(rel_path, 'tracked')
 
             try:
-                stat_info = os.stat(full_path)
-                file_info = FileInfo(
+                # Git already reports the file missing from the work tree - skip the stat
+                if status.endswith('D'):
+                    raise FileNotFoundError(rel_path)
+
+                stat_info = os.stat(os.path.join(work_tree, rel_path))
+                files_info.append(FileInfo(
                     path=rel_path,
-                    status='tracked',
+                    status=status,
                     size=stat_info.st_size,
                     mtime=stat_info.st_mtime,
-                    is_dir=stat.S_ISDIR(stat_info.st_mode)
-                )
-
-                # Get detailed status
-                git_info = self.get_file_git_info(full_path)
-                if git_info:
-                    file_info.status = git_info['status']
-
-                files_info.append(file_info)
+                    is_dir=mode == GITLINK_MODE
+                ))
 
             except (OSError, IOError):
                 # File might be deleted, still include it
-                file_info = FileInfo(
+                files_info.append(FileInfo(
                     path=rel_path,
                     status='deleted',
                     size=0,
                     mtime=0
-                )
-                files_info.append(file_info)
+                ))
 
         return files_info
 
+    def get_tracked_statuses(self) -> Dict[str, str]:
+        """Map each changed tracked file to its porcelain status code (e.g. 'M', 'AM')"""
+        success, stdout, _ = self.run_git_command(['--no-optional-locks', 'status', '--porcelain', '-uno', '-z'])
+        if not success:
+            return {}
+
+        statuses = {}
+        for staged, worktree, path in _parse_porcelain_z(stdout):
+            statuses[path] = f"{staged}{worktree}"
+
+        return statuses
+
+    @require_repo([])
     def get_current_changes(self) -> List[GitChange]:
         """Get current changes (staged and unstaged)"""
-        if not self.is_git_repo_initialized():
-            return []
-
         changes = []
 
-        # Get status with porcelain format
-        success, stdout, _ = self.run_git_command(['status', '--porcelain'])
+        # Get status with porcelain format; read-only, so skip the index refresh write
+        # (background refreshes must not hold index.lock while the user stages files)
+        success, stdout, _ = self.run_git_command(['--no-optional-locks', 'status', '--porcelain', '-z'])
         if not success:
             return []
 
-        for line in stdout.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-
-            if len(line) >= 3:
-                staged = line[0] if line[0] != ' ' else ''
-                worktree = line[1] if line[1] != ' ' else ''
-                file_path = line[3:]  # Skip the first 3 characters (XY filename)
-
-                change_info = GitChange(
-                    file=file_path,
-                    staged=staged,
-                    worktree=worktree,
-                    status_code=f"{staged}{worktree}"
-                )
-                changes.append(change_info)
+        for staged, worktree, file_path in _parse_porcelain_z(stdout):
+            changes.append(GitChange(
+                file=file_path,
+                staged=staged,
+                worktree=worktree,
+                status_code=f"{staged}{worktree}"
+            ))
 
         return changes
 
+    @require_repo(False)
     def is_file_tracked(self, file_path: str) -> bool:
         """Check if a file is tracked by git"""
-        if not self.is_git_repo_initialized():
-            return False
+        work_tree = self.config_manager.work_tree_path
 
-        work_tree = os.path.expanduser(self.config.work_tree)
+        # Convert to a normalized relative path, as listed by ls-files
+        rel_path = os.path.normpath(self._to_rel(file_path, work_tree))
+        if os.path.isabs(rel_path):
+            return False  # Outside the work tree
 
-        # Convert to relative path
-        if file_path.startswith(work_tree):
-            rel_path = os.path.relpath(file_path, work_tree)
-        else:
-            rel_path = file_path
+        tracked = self.get_tracked_set()
+        if rel_path in tracked:
+            return True
 
-        # Use git ls-files to check if file is tracked
-        success, stdout, _ = self.run_git_command(['ls-files', '--', rel_path])
-        return success and stdout.strip() != ""
+        # Directories are tracked when any file below them is
+        if not os.path.isdir(os.path.join(work_tree, rel_path)):
+            return False
+        if rel_path == '.':
+            return bool(tracked)
+        prefix = rel_path + '/'
+        return any(path.startswith(prefix) for path in tracked)
+
+    def get_tracked_set(self) -> FrozenSet[str]:
+        """All tracked paths relative to the work tree, re-listed only when the index changes"""
+        git_dir = self.config_manager.git_dir_path
+        try:
+            # Git replaces the index by rename, so the inode changes on every write
+            index_stat = os.stat(os.path.join(git_dir, 'index'))
+            index_id = (index_stat.st_ino, index_stat.st_mtime_ns, index_stat.st_size)
+        except OSError:
+            index_id = None
+
+        cached = self._tracked_set
+        if cached is not None and cached[0] == git_dir and cached[1] == index_id:
+            return cached[2]
 
+        tracked = frozenset(self.run_git_stream(['ls-files', '-z']))
+        self._tracked_set = (git_dir, index_id, tracked)
+        return tracked
+
+    @require_repo(False)
     def add_single_file(self, file_path: str) -> bool:
         """Add a single file to git repository"""
-        if not self.is_git_repo_initialized():
-            return False
-
-        work_tree = os.path.expanduser(self.config.work_tree)
+        work_tree = self.config_manager.work_tree_path
 
         # Convert to relative path
-        if file_path.startswith(work_tree):
-            rel_path = os.path.relpath(file_path, work_tree)
-        else:
-            rel_path = file_path
+        rel_path = self._to_rel(file_path, work_tree)
 
         # Check if file exists
         full_path = os.path.join(work_tree, rel_path) if not os.path.isabs(file_path) else file_path
@@ -410,18 +778,13 @@ __pycache__/
         success, _, _ = self.run_git_command(['add', rel_path])
         return success
 
+    @require_repo(False)
     def remove_single_file(self, file_path: str) -> bool:
         """Remove a single file from git repository (but keep in filesystem)"""
-        if not self.is_git_repo_initialized():
-            return False
-
-        work_tree = os.path.expanduser(self.config.work_tree)
+        work_tree = self.config_manager.work_tree_path
 
         # Convert to relative path
-        if file_path.startswith(work_tree):
-            rel_path = os.path.relpath(file_path, work_tree)
-        else:
-            rel_path = file_path
+        rel_path = self._to_rel(file_path, work_tree)
 
         # Use git rm --cached to remove from tracking but keep file
         success, _, _ = self.run_git_command(['rm', '--cached', rel_path])
@@ -449,14 +812,12 @@ __pycache__/
 
         success_files = []
         failed_files = {}
-        work_tree = os.path.expanduser(self.config.work_tree)
+        work_tree = self.config_manager.work_tree_path
+        to_add = []  # (original path, path relative to work tree)
 
         for file_path in file_paths:
             # Convert to relative path
-            if file_path.startswith(work_tree):
-                rel_path = os.path.relpath(file_path, work_tree)
-            else:
-                rel_path = file_path
+            rel_path = self._to_rel(file_path, work_tree)
 
             # Check if file exists
             full_path = os.path.join(work_tree, rel_path) if not os.path.isabs(file_path) else file_path
@@ -466,14 +827,27 @@ __pycache__/
                 failed_files[file_path] = error_msg
                 continue
 
-            success, _, stderr = self.run_git_command(['add', rel_path])
+            to_add.append((file_path, rel_path))
+
+        # One git add per chunk of paths instead of one process per file
+        for chunk in _chunk_paths(to_add, key=lambda item: item[1]):
+            success, _, _ = self.run_git_command(['add', '--'] + [rel_path for _, rel_path in chunk])
             if success:
-                success_files.append(file_path)  # Use original path, not rel_path
-                print(f"Added: {rel_path}")
-            else:
-                error_msg = stderr.strip() if stderr else "Unknown git add error"
-                failed_files[file_path] = error_msg
-                print(f"Error adding {rel_path}: {error_msg}")
+                for file_path, rel_path in chunk:
+                    success_files.append(file_path)  # Use original path, not rel_path
+                    print(f"Added: {rel_path}")
+                continue
+
+            # Batch failed - retry this chunk file by file to attribute errors
+            for file_path, rel_path in chunk:
+                success, _, stderr = self.run_git_command(['add', '--', rel_path])
+                if success:
+                    success_files.append(file_path)
+                    print(f"Added: {rel_path}")
+                else:
+                    error_msg = stderr.strip() if stderr else "Unknown git add error"
+                    failed_files[file_path] = error_msg
+                    print(f"Error adding {rel_path}: {error_msg}")
 
         # Report results
         if success_files:
@@ -489,6 +863,8 @@ __pycache__/
             return False
 
         success, _, _ = self.run_git_command(['commit', '-m', message])
+        if success:
+            self._head_state = None
         return success
 
     def generate_commit_message(self, changes: List[GitChange]) -> str:
@@ -496,36 +872,21 @@ __pycache__/
         if not changes:
             return "update: dotfiles configuration"
 
-        # Categorize changes
-        added = [c for c in changes if c.staged == 'A']
-        modified = [c for c in changes if c.staged == 'M']
-        deleted = [c for c in changes if c.staged == 'D']
-        renamed = [c for c in changes if c.staged == 'R']
+        # Categorize changes in a single pass
+        buckets: Dict[str, List[GitChange]] = {code: [] for code in _COMMIT_VERBS}
+        for change in changes:
+            bucket = buckets.get(change.staged)
+            if bucket is not None:
+                bucket.append(change)
 
         parts = []
-        if added:
-            if len(added) == 1:
-                parts.append(f"add {os.path.basename(added[0].file)}")
-            else:
-                parts.append(f"add {len(added)} files")
-
-        if modified:
-            if len(modified) == 1:
-                parts.append(f"update {os.path.basename(modified[0].file)}")
-            else:
-                parts.append(f"update {len(modified)} files")
-
-        if deleted:
-            if len(deleted) == 1:
-                parts.append(f"remove {os.path.basename(deleted[0].file)}")
-            else:
-                parts.append(f"remove {len(deleted)} files")
-
-        if renamed:
-            if len(renamed) == 1:
-                parts.append(f"rename {os.path.basename(renamed[0].file)}")
-            else:
-                parts.append(f"rename {len(renamed)} files")
+        for code, verb in _COMMIT_VERBS.items():
+            bucket = buckets[code]
+            if len(bucket) == 1:
+                # Git paths always use '/', no need for os.path
+                parts.append(f"{verb} {bucket[0].file.rpartition('/')[2]}")
+            elif bucket:
+                parts.append(f"{verb} {len(bucket)} files")
 
         if parts:
             return ", ".join(parts)
@@ -534,25 +895,59 @@ __pycache__/
 
     def parse_git_status_code(self, staged: str, worktree: str) -> Tuple[str, str]:
         """Parse git status codes into readable format"""
-        status_map = {
-            'A': 'Added', 'M': 'Modified', 'D': 'Deleted', 'R': 'Renamed',
-            'C': 'Copied', 'U': 'Updated', '?': 'Untracked', '!': 'Ignored'
-        }
-
-        staged_desc = status_map.get(staged, 'Unknown') if staged else ''
-        worktree_desc = status_map.get(worktree, 'Unknown') if worktree else ''
+        staged_desc = _STATUS_GET(staged, 'Unknown') if staged else ''
+        worktree_desc = _STATUS_GET(worktree, 'Unknown') if worktree else ''
 
         return staged_desc, worktree_desc
 
+    def get_local_config(self) -> Dict[str, str]:
+        """Get repository-local git configuration (keys lowercased, last value wins; shared, do not modify)"""
+        self._wait_for_prefetch()
+        git_dir = self.config_manager.git_dir_path
+        try:
+            # Git rewrites the config through a lock file rename, like the index
+            config_stat = os.stat(os.path.join(git_dir, 'config'))
+            config_id = (config_stat.st_ino, config_stat.st_mtime_ns, config_stat.st_size)
+        except OSError:
+            config_id = None
+
+        cached = self._local_config
+        if cached is not None and cached[0] == git_dir and cached[1] == config_id:
+            return cached[2]
+
+        success, stdout, _ = self.run_git_command(['config', '--local', '--list', '-z'])
+        if not success:
+            return {}
+
+        local_config = {}
+        for entry in stdout.split('\0'):
+            if not entry:
+                continue
+            # With -z each entry is "key\nvalue"
+            key, _, value = entry.partition('\n')
+            local_config[key.lower()] = value
+
+        self._local_config = (git_dir, config_id, local_config)
+        return local_config
+
+    def get_remote_url(self, remote: str = 'origin') -> Optional[str]:
+        """Get a remote's URL from the local configuration, None if it does not exist"""
+        return self.get_local_config().get(f'remote.{remote.lower()}.url')
+
+    def ref_exists(self, ref: str) -> bool:
+        """Check if a ref resolves, through the persistent lookup process when possible"""
+        try:
+            return self.get_batch_check().exists(ref)
+        except OSError:
+            success, _, _ = self.run_git_command(['show-ref', '--verify', '--quiet', ref])
+            return success
+
+    @require_repo((False, ["Git repository not initialized"]))
     def verify_git_configuration(self) -> Tuple[bool, List[str]]:
         """Verify that all required git configurations are properly set"""
-        if not self.is_git_repo_initialized():
-            return False, ["Git repository not initialized"]
-
         issues = []
-        config = self.config
-        work_tree = os.path.expanduser(config.work_tree)
-        gitignore_path = os.path.expanduser('~/.config/dotfiles-manager/.gitignore')
+        work_tree = self.config_manager.work_tree_path
+        gitignore_path = self.config_manager.expand_path(DEFAULT_GITIGNORE)
 
         # Check essential configurations
         checks = [
@@ -561,12 +956,15 @@ __pycache__/
             ('core.excludesfile', gitignore_path)
         ]
 
+        # Read all local configuration with a single git call
+        local_config = self.get_local_config()
+
         for config_key, expected_value in checks:
-            success, stdout, _ = self.run_git_command(['config', '--local', config_key])
-            if not success:
+            value = local_config.get(config_key.lower())
+            if value is None:
                 issues.append(f"Missing configuration: {config_key}")
-            elif stdout.strip() != expected_value:
-                issues.append(f"Incorrect {config_key}: expected '{expected_value}', got '{stdout.strip()}'")
+            elif value != expected_value:
+                issues.append(f"Incorrect {config_key}: expected '{expected_value}', got '{value}'")
 
         # Check if .gitignore exists
         if not os.path.exists(gitignore_path):
@@ -574,115 +972,121 @@ __pycache__/
 
         return len(issues) == 0, issues
 
+    @require_repo(False)
     def push_changes(self) -> bool:
         """Push committed changes to remote repository"""
-        if not self.is_git_repo_initialized():
-            return False
-
         success, _, _ = self.run_git_command(['push', 'origin', 'main'])
         return success
 
-    def get_push_status(self) -> tuple[bool, int, list]:
-        """Get push status - returns (has_remote, commits_ahead, commit_list)"""
+    def push_changes_async(self, callback: Callable[[bool, str], None]) -> Optional[threading.Thread]:
+        """Push in a background thread, callback receives (success, stderr) from that thread"""
         if not self.is_git_repo_initialized():
-            return False, 0, []
-
-        # Check if remote is configured
-        if not self.config.remote:
-            return False, 0, []
-
-        # Check if we have any commits
-        has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
-        if not has_commits:
-            return True, 0, []
-
-        # Get commits ahead of remote
-        success, output, _ = self.run_git_command(['rev-list', '--count', 'HEAD', '--not', '--remotes'])
-        if not success:
-            # If command fails, try to fetch and check again
-            self.run_git_command(['fetch', 'origin'])
-            success, output, _ = self.run_git_command(['rev-list', '--count', 'HEAD', '--not', '--remotes'])
-            if not success:
-                return True, 0, []
-
-        try:
-            commits_ahead = int(output.strip())
-        except (ValueError, AttributeError):
-            commits_ahead = 0
+            callback(False, "Git repository not initialized")
+            return None
 
-        commit_list = []
-        if commits_ahead > 0:
-            # Get list of commits to push
-            success, commit_output, _ = self.run_git_command([
-                'log', '--oneline', f'HEAD~{commits_ahead}..HEAD'
-            ])
-            if success and commit_output:
-                commit_list = [line.strip() for line in commit_output.strip().split('\n') if line.strip()]
+        command = self.get_git_command_base() + ['push', 'origin', 'main']
+        cwd = self.config_manager.work_tree_path
 
-        return True, commits_ahead, commit_list
-
-    def get_pull_status(self) -> tuple[bool, int, list]:
-        """Get pull status - returns (has_remote, commits_behind, commit_list)"""
-        if not self.is_git_repo_initialized():
-            return False, 0, []
+        # The TUI owns the terminal in raw mode - credential and passphrase prompts
+        # must fail instead of competing with it for keystrokes
+        env = {**self._git_env, 'GIT_TERMINAL_PROMPT': '0'}
+        env.setdefault('GIT_SSH_COMMAND', 'ssh -o BatchMode=yes')
 
+        def worker():
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    cwd=cwd,
+                    env=env,
+                    # No controlling terminal, so ssh cannot open /dev/tty either
+                    start_new_session=(os.name == 'posix')
+                )
+                _, stderr = process.communicate()
+                callback(process.returncode == 0, stderr)
+            except (OSError, subprocess.SubprocessError) as e:
+                callback(False, str(e))
+            finally:
+                with _pending_pushes_lock:
+                    _pending_pushes.remove(threading.current_thread())
+
+        thread = threading.Thread(target=worker, name="git-push")
+        with _pending_pushes_lock:
+            _pending_pushes.append(thread)
+        thread.start()
+        return thread
+
+    def is_push_in_progress(self) -> bool:
+        """Check if a background push is still running"""
+        with _pending_pushes_lock:
+            return bool(_pending_pushes)
+
+    def wait_for_pushes(self):
+        """Block until background pushes have finished"""
+        _join_pending_pushes()
+
+    @require_repo((False, [], []))
+    def get_sync_status(self, fetch: bool = True) -> Tuple[bool, List[str], List[str]]:
+        """Get sync status - returns (has_remote, commits_to_push, commits_to_pull) as oneline logs"""
         # Check if remote is configured
         if not self.config.remote:
-            return False, 0, []
+            return False, [], []
 
         # Check if we have any commits
-        has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
+        has_commits = self.has_commits()
         if not has_commits:
-            return True, 0, []
+            return True, [], []
 
         # Fetch latest from remote first
-        self.run_git_command(['fetch', 'origin'])
+        if fetch:
+            self.run_git_command(['fetch', 'origin'])
 
-        # Get commits behind remote
-        success, output, _ = self.run_git_command(['rev-list', '--count', '--remotes', '--not', 'HEAD'])
+        # Both directions in one call: '<' commits are only local, '>' only on origin/main
+        success, output, _ = self.run_git_command(['log', '--oneline', '--left-right', 'HEAD...origin/main'])
+        if success:
+            ahead, behind = [], []
+            for line in output.split('\n'):
+                if line.startswith('<'):
+                    ahead.append(line[1:].strip())
+                elif line.startswith('>'):
+                    behind.append(line[1:].strip())
+            return True, ahead, behind
+
+        # origin/main does not exist yet (nothing pushed) - everything not on a remote is ahead
+        success, output, _ = self.run_git_command(['log', '--oneline', 'HEAD', '--not', '--remotes'])
         if not success:
-            return True, 0, []
-
-        try:
-            commits_behind = int(output.strip())
-        except (ValueError, AttributeError):
-            commits_behind = 0
+            return True, [], []
+        return True, [line.strip() for line in output.split('\n') if line.strip()], []
 
-        commit_list = []
-        if commits_behind > 0:
-            # Get list of commits to pull
-            success, commit_output, _ = self.run_git_command([
-                'log', '--oneline', f'HEAD..origin/main'
-            ])
-            if success and commit_output:
-                commit_list = [line.strip() for line in commit_output.strip().split('\n') if line.strip()]
+    def get_push_status(self) -> tuple[bool, int, list]:
+        """Get push status - returns (has_remote, commits_ahead, commit_list)"""
+        has_remote, ahead, _ = self.get_sync_status(fetch=False)
+        return has_remote, len(ahead), ahead
 
-        return True, commits_behind, commit_list
+    def get_pull_status(self) -> tuple[bool, int, list]:
+        """Get pull status - returns (has_remote, commits_behind, commit_list)"""
+        has_remote, _, behind = self.get_sync_status()
+        return has_remote, len(behind), behind
 
+    @require_repo(False)
     def pull_changes(self) -> bool:
         """Pull changes from remote repository"""
-        if not self.is_git_repo_initialized():
-            return False
-
         # Check if remote origin exists
-        remote_exists, _, _ = self.run_git_command(['remote', 'get-url', 'origin'])
-        if not remote_exists:
+        if self.get_remote_url() is None:
             return False
 
         # Check if repository has any commits
-        has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
+        has_commits = self.has_commits()
+        # Pull may create or move HEAD
+        self._head_state = None
 
         if not has_commits:
             # Repository is empty, do initial pull to create main branch
             success, _, stderr = self.run_git_command(['pull', 'origin', 'main'])
-            overwrite_keywords = [
-                "sarebbero sovrascritti dal merge",
-                "would be overwritten by merge",
-                "would be overwritten by checkout",
-                "untracked working tree files would be overwritten",
-                "The following untracked working tree files would be overwritten"
-            ]
-            has_overwrite_error = any(keyword in stderr.lower() for keyword in overwrite_keywords)
+            has_overwrite_error = bool(_OVERWRITE_RE.search(stderr))
 
             if not success and has_overwrite_error:
                 # Untracked files would be overwritten, create backup first
@@ -704,7 +1108,7 @@ __pycache__/
         # Try pull with upstream first
         success, _, stderr = self.run_git_command(['pull'])
 
-        if not success and "no tracking information" in stderr.lower():
+        if not success and _NO_TRACKING_RE.search(stderr):
             # No upstream configured, try with --set-upstream
             success, _, stderr = self.run_git_command(['pull', '--set-upstream', 'origin', 'main'])
             if success:
@@ -712,14 +1116,7 @@ __pycache__/
                 self.run_git_command(['branch', '--set-upstream-to=origin/main', 'main'])
         elif not success:
             # Check if files would be overwritten
-            overwrite_keywords = [
-                "sarebbero sovrascritti dal merge",
-                "would be overwritten by merge",
-                "would be overwritten by checkout",
-                "untracked working tree files would be overwritten",
-                "The following untracked working tree files would be overwritten"
-            ]
-            has_overwrite_error = any(keyword in stderr.lower() for keyword in overwrite_keywords)
+            has_overwrite_error = bool(_OVERWRITE_RE.search(stderr))
 
             if has_overwrite_error:
                 print(f"🔍 Detected overwrite error: {stderr}")
@@ -741,11 +1138,9 @@ __pycache__/
 
         return success
 
+    @require_repo(False)
     def unstage_all_changes(self) -> bool:
         """Remove all changes from staging area"""
-        if not self.is_git_repo_initialized():
-            return False
-
         # Get list of staged files first
         changes = self.get_current_changes()
         staged_files = [change.file for change in changes if change.staged and change.staged != ' ']
@@ -754,41 +1149,27 @@ __pycache__/
             return True  # Nothing to unstage
 
         # Check if repository has any commits
-        has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
+        has_commits = self.has_commits()
         if not has_commits:
             # If no commits exist, use git rm --cached for each staged file
-            work_tree = os.path.expanduser(self.config.work_tree)
-            rel_paths = []
-            for file_path in staged_files:
-                if file_path.startswith(work_tree):
-                    rel_path = os.path.relpath(file_path, work_tree)
-                else:
-                    rel_path = file_path
-                rel_paths.append(rel_path)
+            work_tree = self.config_manager.work_tree_path
+            rel_paths = [self._to_rel(file_path, work_tree) for file_path in staged_files]
 
-            if rel_paths:
-                success, _, _ = self.run_git_command(['rm', '--cached'] + rel_paths)
-                return success
-            return True
+            return self.run_git_command_chunked(['rm', '--cached'], rel_paths)
         else:
             success, _, _ = self.run_git_command(['reset', 'HEAD'])
             return success
 
+    @require_repo(False)
     def unstage_single_file(self, file_path: str) -> bool:
         """Remove a single file from staging area"""
-        if not self.is_git_repo_initialized():
-            return False
-
-        work_tree = os.path.expanduser(self.config.work_tree)
+        work_tree = self.config_manager.work_tree_path
 
         # Convert to relative path
-        if file_path.startswith(work_tree):
-            rel_path = os.path.relpath(file_path, work_tree)
-        else:
-            rel_path = file_path
+        rel_path = self._to_rel(file_path, work_tree)
 
         # Check if repository has any commits
-        has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
+        has_commits = self.has_commits()
         if not has_commits:
             # If no commits exist, use git rm --cached to unstage
             success, _, _ = self.run_git_command(['rm', '--cached', rel_path])
@@ -797,41 +1178,29 @@ __pycache__/
             success, _, _ = self.run_git_command(['reset', 'HEAD', rel_path])
             return success
 
+    @require_repo(False)
     def unstage_multiple_files(self, file_paths: List[str]) -> bool:
         """Remove multiple files from staging area"""
-        if not self.is_git_repo_initialized():
-            return False
-
         if not file_paths:
             return True
 
-        work_tree = os.path.expanduser(self.config.work_tree)
-        rel_paths = []
+        work_tree = self.config_manager.work_tree_path
 
         # Convert all paths to relative paths
-        for file_path in file_paths:
-            if file_path.startswith(work_tree):
-                rel_path = os.path.relpath(file_path, work_tree)
-            else:
-                rel_path = file_path
-            rel_paths.append(rel_path)
+        rel_paths = [self._to_rel(file_path, work_tree) for file_path in file_paths]
 
         # Check if repository has any commits
-        has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
+        has_commits = self.has_commits()
         if not has_commits:
             # If no commits exist, use git rm --cached to unstage
-            success, _, _ = self.run_git_command(['rm', '--cached'] + rel_paths)
-            return success
+            return self.run_git_command_chunked(['rm', '--cached'], rel_paths)
         else:
-            # Run git reset for all files at once
-            success, _, _ = self.run_git_command(['reset', 'HEAD'] + rel_paths)
-            return success
+            # Run git reset for as many files per call as the command line allows
+            return self.run_git_command_chunked(['reset', 'HEAD'], rel_paths)
 
+    @require_repo({"initialized": False, "error": "Repository not initialized"})
     def get_git_status_info(self) -> Dict[str, Any]:
         """Get comprehensive git status information"""
-        if not self.is_git_repo_initialized():
-            return {"initialized": False, "error": "Repository not initialized"}
-
         info = {
             "initialized": True,
             "configurations": {},
@@ -840,16 +1209,14 @@ __pycache__/
             "changes_count": 0
         }
 
-        # Get configurations
+        # Get configurations from a single read of the local config
+        local_config = self.get_local_config()
         config_keys = ['status.showUntrackedFiles', 'core.worktree', 'core.excludesfile']
         for key in config_keys:
-            success, value, _ = self.run_git_command(['config', '--local', key])
-            info["configurations"][key] = value.strip() if success else "Not set"
+            info["configurations"][key] = local_config.get(key.lower(), "Not set")
 
-        # Get remote info
-        success, remotes, _ = self.run_git_command(['remote', '-v'])
-        if success and remotes.strip():
-            info["remote"] = remotes.strip().split('\n')[0]
+        # Get remote info (origin URL, None if not configured)
+        info["remote"] = local_config.get('remote.origin.url')
 
         # Get file counts
         tracked_files = self.get_tracked_files_info()
@@ -859,47 +1226,44 @@ __pycache__/
 
         return info
 
-    def _setup_upstream_tracking(self) -> bool:
-        """Set up upstream tracking for main branch to origin/main"""
+    def _setup_upstream_tracking(self, has_commits: Optional[bool] = None) -> bool:
+        """Set up upstream tracking for main branch to origin/main (pass has_commits when already known)"""
         try:
             # Check if repository has any commits
-            has_commits, _, _ = self.run_git_command(['rev-parse', 'HEAD'])
+            if has_commits is None:
+                has_commits = self.has_commits()
 
             if not has_commits:
                 # No commits yet - just set the upstream configuration
                 # This will be used when the first push happens
-                success, _, _ = self.run_git_command(['config', 'branch.main.remote', 'origin'])
-                if success:
-                    success, _, _ = self.run_git_command(['config', 'branch.main.merge', 'refs/heads/main'])
+                local_config = self.get_local_config()
+                success = True
+                # Only write keys that are not already set (no spawn when nothing changes)
+                for key, value in (('branch.main.remote', 'origin'), ('branch.main.merge', 'refs/heads/main')):
+                    if success and local_config.get(key) != value:
+                        success, _, _ = self.run_git_command(['config', key, value])
                 return success
 
             # Check if main branch exists
-            success, _, _ = self.run_git_command(['show-ref', '--verify', '--quiet', 'refs/heads/main'])
-            if not success:
+            if not self.ref_exists('refs/heads/main'):
                 # Create main branch if it doesn't exist
                 success, _, _ = self.run_git_command(['checkout', '-b', 'main'])
                 if not success:
                     return False
 
-            # Set upstream tracking for both push and pull
+            # Set upstream tracking for both push and pull (writes branch.main.remote and .merge,
+            # so a separate `branch --set-upstream-to` is not needed)
             success, _, _ = self.run_git_command(['push', '--set-upstream', 'origin', 'main'])
-            if success:
-                # Set upstream tracking for pull operations
-                success, _, _ = self.run_git_command(['branch', '--set-upstream-to=origin/main', 'main'])
             return success
         except Exception:
             return False
 
+    @require_repo(False)
     def update_remote_origin(self, remote_url: str) -> bool:
         """Update or add remote origin with the given URL"""
-        if not self.is_git_repo_initialized():
-            return False
-
         try:
             # Check if origin remote exists
-            success, _, _ = self.run_git_command(['remote', 'get-url', 'origin'])
-
-            if success:
+            if self.get_remote_url() is not None:
                 # Remote exists, update it
                 success, _, _ = self.run_git_command(['remote', 'set-url', 'origin', remote_url])
                 if success:
@@ -918,15 +1282,12 @@ __pycache__/
             print(f"Error updating remote: {e}")
             return False
 
+    @require_repo(False)
     def remove_remote_origin(self) -> bool:
         """Remove remote origin"""
-        if not self.is_git_repo_initialized():
-            return False
-
         try:
             # Check if origin exists first
-            success, _, _ = self.run_git_command(['remote', 'get-url', 'origin'])
-            if success:
+            if self.get_remote_url() is not None:
                 # Remove origin remote
                 success, _, _ = self.run_git_command(['remote', 'remove', 'origin'])
                 return success
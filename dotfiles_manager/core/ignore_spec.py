@@ -0,0 +1,84 @@
+"""
+Ignore Spec
+Gitignore matching for the work tree, reloaded when the ignore files change.
+"""
+
+import os
+import threading
+from typing import List, Optional, Tuple
+
+# Optional dependency - without it nothing is treated as ignored
+try:
+    import pathspec
+    PATHSPEC_AVAILABLE = True
+except ImportError:
+    pathspec = None
+    PATHSPEC_AVAILABLE = False
+
+# Global gitignore created by GitManager.initialize_git_repo
+DEFAULT_GITIGNORE = "~/.config/dotfiles-manager/.gitignore"
+
+def spec_matches(spec, rel_path: str, is_dir: bool = False) -> bool:
+    """Check a path relative to the work tree against a spec returned by IgnoreSpec.current"""
+    if is_dir:
+        # Let directory patterns such as "build/" match the directory itself
+        rel_path += '/'
+    return spec.match_file(rel_path)
+
+class IgnoreSpec:
+    """Matches work tree paths against the global and work tree .gitignore files"""
+
+    def __init__(self, work_tree: str):
+        self.work_tree = os.path.abspath(work_tree)
+        self.ignore_files = (
+            os.path.expanduser(DEFAULT_GITIGNORE),
+            os.path.join(self.work_tree, '.gitignore')
+        )
+
+        self._spec = None
+        self._mtimes: Optional[Tuple[Optional[int], ...]] = None
+        self._lock = threading.Lock()
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Check if a path relative to the work tree is ignored"""
+        spec = self.current()
+        return spec is not None and spec_matches(spec, rel_path, is_dir)
+
+    def current(self):
+        """Compiled spec (None if nothing is ignored), rebuilt only when an ignore file changed
+
+        Stats the ignore files on every call - to match many paths, call it once and
+        pass the spec to spec_matches.
+        """
+        if not PATHSPEC_AVAILABLE:
+            return None
+
+        mtimes = tuple(self._get_mtime(path) for path in self.ignore_files)
+        with self._lock:
+            if mtimes != self._mtimes:
+                self._spec = self._compile()
+                self._mtimes = mtimes
+            return self._spec
+
+    def _compile(self):
+        """Build a gitignore matcher from the ignore files"""
+        lines: List[str] = []
+        for ignore_file in self.ignore_files:
+            try:
+                with open(ignore_file, 'r', encoding='utf-8') as f:
+                    lines.extend(f.read().splitlines())
+            except (OSError, IOError, UnicodeDecodeError):
+                continue
+
+        if not lines:
+            return None
+
+        return pathspec.PathSpec.from_lines('gitwildmatch', lines)
+
+    @staticmethod
+    def _get_mtime(path: str) -> Optional[int]:
+        """Get file modification time in nanoseconds, None if missing"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
@@ -4,11 +4,31 @@ Handles error logging for the dotfiles manager application.
 """
 
 import os
-import datetime
-import traceback
-from typing import Optional
+import atexit
+import queue
+import sys
+import threading
+import time
+import weakref
+from typing import List, Optional
 from ..common import Config
 
+# Pending entries per logger; when full, new entries are dropped instead of blocking
+LOG_QUEUE_SIZE = 1024
+
+# Log size that triggers rotation to error.log.1 (at most two files are kept)
+LOG_MAX_BYTES = 5 << 20
+
+# Loggers with a running writer thread, flushed at interpreter exit
+_active_loggers: "weakref.WeakSet[Logger]" = weakref.WeakSet()
+
+def _close_active_loggers():
+    """Write out entries still queued when the app exits"""
+    for logger in list(_active_loggers):
+        logger.close()
+
+atexit.register(_close_active_loggers)
+
 class Logger:
     """Simple logger for error tracking"""
 
@@ -21,23 +41,41 @@ class Logger:
             log_dir = os.path.dirname(self.log_file)
             os.makedirs(log_dir, exist_ok=True)
 
+        # Entries are written by a background thread that keeps the file open
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
     def log_error(self, error: Exception, context: str = ""):
         """Log an error with timestamp and context"""
         if not self.config.enable_logging:
             return
 
         try:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"\n{'='*60}\n")
-                f.write(f"TIMESTAMP: {timestamp}\n")
-                f.write(f"CONTEXT: {context}\n")
-                f.write(f"ERROR: {str(error)}\n")
-                f.write(f"TYPE: {type(error).__name__}\n")
-                f.write("TRACEBACK:\n")
-                f.write(traceback.format_exc())
-                f.write(f"{'='*60}\n")
+            # Imported here - only needed once logging is enabled and an error occurs
+            import traceback
+
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+
+            # Traceback of the error itself once raised, else of the exception this thread
+            # is handling (errors are often wrapped in a fresh, never raised Exception)
+            traced = error if error.__traceback__ is not None else sys.exc_info()[1]
+
+            parts = [
+                f"\n{'='*60}\n",
+                f"TIMESTAMP: {timestamp}\n",
+                f"CONTEXT: {context}\n",
+                f"ERROR: {str(error)}\n",
+                f"TYPE: {type(error).__name__}\n",
+                "TRACEBACK:\n"
+            ]
+            if traced is not None:
+                parts.extend(traceback.TracebackException.from_exception(traced).format())
+            else:
+                parts.append("NoneType: None\n")
+            parts.append(f"{'='*60}\n")
+
+            self._enqueue(''.join(parts))
 
         except Exception:
             # If logging fails, don't crash the app
@@ -49,10 +87,8 @@ class Logger:
             return
 
         try:
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"\n[{timestamp}] INFO ({context}): {message}\n")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._enqueue(f"\n[{timestamp}] INFO ({context}): {message}\n")
 
         except Exception:
             # If logging fails, don't crash the app
@@ -68,12 +104,94 @@ class Logger:
             return False
 
         try:
+            # Let queued entries land first so they are cleared too
+            self.flush()
+            # Drop the rotated log as well
+            if os.path.exists(self.log_file + ".1"):
+                os.remove(self.log_file + ".1")
             with open(self.log_file, "w", encoding="utf-8") as f:
-                f.write(f"# Dotfiles Manager Log - Cleared {datetime.datetime.now()}\n")
+                f.write(f"# Dotfiles Manager Log - Cleared {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             return True
         except Exception:
             return False
 
+    def flush(self):
+        """Wait until all queued entries are written"""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Write queued entries and stop the writer thread"""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is None or not writer.is_alive():
+            return
+
+        try:
+            self._queue.put(None, timeout=1.0)
+        except queue.Full:
+            return
+        writer.join(timeout=2.0)
+
+    def _enqueue(self, entry: str):
+        """Hand an entry to the writer thread without blocking"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._drain, name="dotfiles-logger", daemon=True)
+                self._writer.start()
+                _active_loggers.add(self)
+
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            pass
+
+    def _drain(self):
+        """Writer thread: append queued entries in batches through one open file"""
+        f = None
+        stopping = False
+
+        while not stopping:
+            batch: List[str] = []
+            entry = self._queue.get()
+            while True:
+                if entry is None:
+                    stopping = True
+                else:
+                    batch.append(entry)
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                if batch:
+                    if f is None:
+                        f = open(self.log_file, "ab")
+                    # One encode and one write per batch, no text layer
+                    f.write(''.join(batch).encode('utf-8'))
+                    f.flush()
+
+                    if f.tell() > LOG_MAX_BYTES:
+                        # Rotate: keep one previous log, start a fresh file
+                        f.close()
+                        f = None
+                        os.replace(self.log_file, self.log_file + ".1")
+            except Exception:
+                # If logging fails, don't crash the app - reopen on the next batch
+                if f is not None:
+                    try:
+                        f.close()
+                    except OSError:
+                        pass
+                    f = None
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+
+        if f is not None:
+            f.close()
+
     def get_log_size(self) -> int:
         """Get log file size in bytes"""
         try:
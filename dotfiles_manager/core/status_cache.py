@@ -0,0 +1,85 @@
+"""
+Status Cache
+Caches git status results with stale-while-revalidate semantics.
+"""
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+from ..common import GitChange
+
+class StatusCache:
+    """In-memory cache for git changes with background revalidation"""
+
+    def __init__(self, fetch: Callable[[], List[GitChange]], ttl: float = 2.0, max_age: float = 30.0):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.max_age = max_age
+
+        self._changes: Optional[List[GitChange]] = None
+        self._timestamp = 0.0
+        self._generation = 0
+        self._in_flight: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def get_or_refresh(self, ttl: Optional[float] = None) -> List[GitChange]:
+        """Return cached changes, refreshing in the background when stale"""
+        ttl = self.ttl if ttl is None else ttl
+
+        with self._lock:
+            changes = self._changes
+            age = time.monotonic() - self._timestamp
+
+        # Nothing cached or too old to show - fetch synchronously
+        if changes is None or age >= self.max_age:
+            return self.refresh()
+
+        # Stale but usable - serve it and revalidate in the background
+        if age >= ttl:
+            self._refresh_async()
+
+        return changes
+
+    def refresh(self) -> List[GitChange]:
+        """Fetch changes synchronously and store them"""
+        with self._lock:
+            generation = self._generation
+
+        changes = self._fetch()
+        self._store(changes, generation)
+        return changes
+
+    def invalidate(self):
+        """Drop cached changes so the next read forces a fresh fetch"""
+        with self._lock:
+            self._changes = None
+            self._timestamp = 0.0
+            # Results of refreshes started before this point are discarded
+            self._generation += 1
+
+    def _refresh_async(self):
+        """Start a background refresh unless one is already running"""
+        with self._lock:
+            if self._in_flight is not None and self._in_flight.is_alive():
+                return
+            generation = self._generation
+            thread = threading.Thread(target=self._background_refresh, args=(generation,), daemon=True)
+            self._in_flight = thread
+        thread.start()
+
+    def _background_refresh(self, generation: int):
+        """Background worker for stale-while-revalidate"""
+        try:
+            changes = self._fetch()
+        except Exception:
+            # Keep serving the stale value; the next read will retry
+            return
+        self._store(changes, generation)
+
+    def _store(self, changes: List[GitChange], generation: int):
+        """Store fetched changes if no invalidation happened meanwhile"""
+        with self._lock:
+            if generation == self._generation:
+                self._changes = changes
+                self._timestamp = time.monotonic()
@@ -4,6 +4,7 @@ Abstract interface for user interface implementations.
 This allows easy swapping between different UI frameworks (Rich, Textual, Curses, etc.).
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 from ..common import FileInfo, DirectoryItem, GitChange
@@ -36,6 +37,10 @@ class UIInterface(ABC):
         """Display informational message"""
         pass
 
+    def schedule_dismiss_after(self, seconds: float):
+        """Keep the last message visible for `seconds` (default implementation blocks)"""
+        time.sleep(seconds)
+
     @abstractmethod
     def confirm(self, message: str, default: bool = False) -> bool:
         """Show confirmation dialog"""
@@ -70,7 +75,7 @@ class UIInterface(ABC):
         pass
 
     @abstractmethod
-    def show_modified_files(self, changes: List[GitChange]) -> Optional[Dict[str, Any]]:
+    def show_modified_files(self, changes: List[GitChange], git_manager) -> Optional[Dict[str, Any]]:
         """Display modified files and return user action"""
         pass
 
@@ -3,10 +3,15 @@ Rich UI Implementation
 User interface implementation using the Rich library.
 """
 
+import functools
 import os
+import select
+import signal
 import sys
 import time
-from typing import List, Optional, Dict, Any
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Platform-specific imports for keyboard input
 try:
@@ -17,9 +22,11 @@ except ImportError:
     import msvcrt
     UNIX_PLATFORM = False
 
-from rich.console import Console, Group
+from rich.console import Console, ConsoleDimensions, Group
 from rich.panel import Panel
 from rich.text import Text
+from rich.live import Live
+from rich.style import Style
 from rich import box
 from rich.prompt import Prompt
 
@@ -30,16 +37,164 @@ from ..common import MAT_TEXT_PRIMARY, MAT_TEXT_SECONDARY, MAT_TEXT_HINT
 from ..common import MAT_DIR_NORMAL, MAT_DIR_HIDDEN, MAT_FILE_NORMAL, MAT_FILE_HIDDEN
 from ..common import MAT_SORT_BLUE, MAT_SORT_ORANGE, MAT_SORT_GREEN, MAT_BANANA
 from ..common import FileInfo, DirectoryItem, GitChange
+from ..common import format_file_sizes, format_file_mtimes
 
 # Initialize Rich console
 console = Console()
 
+# Main menu entries as (key, title, description)
+MAIN_MENU_OPTIONS = [
+    ("1", "🐙  Browse Files", "Browse and add files to repository"),
+    ("2", "🍻  Modified Files", "View current changes and commit"),
+    ("3", "📋  Tracked Files", "List all tracked files"),
+    ("4", "🐒  Settings", "Configure paths and options"),
+    ("5", "💀  Exit", "Exit the dotfiles manager")
+]
+
+MAIN_MENU_HEADER = """╔═══════════════════════════════════════╗
+║  🐉  D O T F I L E S   M A N A G E R  ║
+║    Manage your configuration files    ║
+╚═══════════════════════════════════════╝"""
+
+# Seconds to wait for the rest of an escape sequence before treating ESC as a standalone key
+POLL_WAIT = 0.02
+
+# Bytes read past the end of the previous key (e.g. held arrow keys), consumed first
+_pending_input = bytearray()
+
+def _read_input(fd: int, timeout: Optional[float] = None) -> bytes:
+    """Read whatever input is available in one syscall, b'' if none arrives within timeout"""
+    if _pending_input:
+        data = bytes(_pending_input)
+        _pending_input.clear()
+        return data
+    if timeout is not None and not select.select([fd], [], [], timeout)[0]:
+        return b''
+    return os.read(fd, 32)
+
+def _key_length(data: bytes) -> Optional[int]:
+    """Length of the first key in data (escape sequence or UTF-8 character), None if incomplete"""
+    if data[0] == 0x1b:
+        if len(data) == 1:
+            return None
+        if data[1] == ord('['):
+            # CSI sequence ends with its final byte (arrows 'A'-'D', page keys '~')
+            for i in range(2, len(data)):
+                if 0x40 <= data[i] <= 0x7e:
+                    return i + 1
+            return None
+        return 2
+    length = 4 if data[0] >= 0xf0 else 3 if data[0] >= 0xe0 else 2 if data[0] >= 0xc0 else 1
+    return length if len(data) >= length else None
+
+def _read_key_bytes(fd: int) -> str:
+    """Read one key from a raw mode terminal"""
+    data = _read_input(fd)
+    if not data:
+        return ''  # EOF
+    length = _key_length(data)
+    while length is None:
+        # Standalone ESC (or a truncated sequence) unless more input follows within POLL_WAIT
+        more = _read_input(fd, POLL_WAIT)
+        if not more:
+            length = len(data)
+            break
+        data += more
+        length = _key_length(data)
+
+    _pending_input.extend(data[length:])
+    return data[:length].decode('utf-8', errors='replace')
+
+def _is_printable_key(key: str) -> bool:
+    """Single printable character (search input)"""
+    return len(key) == 1 and key.isprintable()
+
+def drain_keys(fd: int, timeout: float = 0.0) -> List[str]:
+    """Read all queued input in as few syscalls as possible and split it into keys"""
+    while select.select([fd], [], [], timeout)[0]:
+        data = os.read(fd, 256)
+        if not data:
+            break
+        _pending_input.extend(data)
+        timeout = 0.0
+
+    keys = []
+    while _pending_input:
+        length = _key_length(_pending_input)
+        if length is None:
+            break  # Incomplete key, completed by the next get_key
+        keys.append(bytes(_pending_input[:length]).decode('utf-8', errors='replace'))
+        del _pending_input[:length]
+    return keys
+
+def take_queued_keys(accept: Callable[[str], bool]) -> List[str]:
+    """Take the run of already queued keys accepted by accept (pastes, held keys), leave the rest queued"""
+    if not _raw_mode_active:
+        return []
+
+    keys = drain_keys(sys.stdin.fileno())
+    taken = 0
+    while taken < len(keys) and accept(keys[taken]):
+        taken += 1
+    _pending_input[:0] = ''.join(keys[taken:]).encode('utf-8')
+    return keys[:taken]
+
+# Bumped by SIGWINCH; cached terminal sizes older than this are re-read
+_resize_count = 0
+_resize_watched = False
+
+def _on_resize(signum, frame, previous=None):
+    """SIGWINCH handler: invalidate cached terminal sizes, then chain to the previous handler"""
+    global _resize_count
+    _resize_count += 1
+    if callable(previous):
+        previous(signum, frame)
+
+def _watch_resize() -> bool:
+    """Install the SIGWINCH handler once, False where resizes cannot be signalled"""
+    global _resize_watched
+    if not _resize_watched and hasattr(signal, 'SIGWINCH'):
+        try:
+            previous = signal.getsignal(signal.SIGWINCH)
+            signal.signal(signal.SIGWINCH, lambda signum, frame: _on_resize(signum, frame, previous))
+            _resize_watched = True
+        except ValueError:
+            # Not the main thread
+            pass
+    return _resize_watched
+
+# True while an interactive view holds the terminal in raw mode (see raw_stdin)
+_raw_mode_active = False
+
+@contextmanager
+def raw_stdin():
+    """Keep a terminal stdin in raw mode for a whole interactive view instead of per key"""
+    global _raw_mode_active
+    if not UNIX_PLATFORM or _raw_mode_active or not sys.stdin.isatty():
+        yield
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        # Keep output processing on so the views' newlines still return the carriage
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSADRAIN, mode)
+        _raw_mode_active = True
+        yield
+    finally:
+        _raw_mode_active = False
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
 def get_key():
     """Cross-platform single key input function with fallback"""
     try:
         if os.name == 'nt':  # Windows
             import msvcrt
-            return msvcrt.getch().decode('utf-8')
+            # Wide-char read returns str directly, no per-byte decode
+            return msvcrt.getwch()
         else:  # Unix/Linux/MacOS
             # Check if stdin is a terminal
             if not sys.stdin.isatty():
@@ -52,55 +207,233 @@ def get_key():
                     return 'y'
 
             fd = sys.stdin.fileno()
+            if _raw_mode_active:
+                return _read_key_bytes(fd)
+
             old_settings = termios.tcgetattr(fd)
             try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
-
-                # Handle ESC sequences - improved approach
-                if key == KeyCodes.ESC:  # ESC sequences (arrows, function keys, etc.)
-                    try:
-                        # Read first part of escape sequence
-                        next_char = sys.stdin.read(1)
-                        if next_char == '[':
-                            # Could be arrow keys or page up/down
-                            third_char = sys.stdin.read(1)
-                            full_sequence = key + next_char + third_char
-
-                            # Check for arrow keys
-                            if full_sequence in [KeyCodes.ARROW_UP, KeyCodes.ARROW_DOWN,
-                                               KeyCodes.ARROW_LEFT, KeyCodes.ARROW_RIGHT]:
-                                return full_sequence
-
-                            # Check for page up/down (need one more character)
-                            if third_char in ['5', '6']:
-                                fourth_char = sys.stdin.read(1)
-                                full_sequence = key + next_char + third_char + fourth_char
-                                if full_sequence in [KeyCodes.PAGE_UP, KeyCodes.PAGE_DOWN]:
-                                    return full_sequence
-
-                            # Return whatever sequence we got
-                            return full_sequence
-                        elif len(next_char) == 0:
-                            return KeyCodes.ESC  # Standalone ESC
-                        else:
-                            return key + next_char
-                    except:
-                        return KeyCodes.ESC  # Standalone ESC on error
-
-                return key
+                tty.setraw(fd)
+                # Raw fd reads with select() timeouts - ESC sequences arrive in one read
+                return _read_key_bytes(fd)
             finally:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     except Exception:
         # Ultimate fallback - return 'y' for automation environments
         return 'y'
 
+# Seconds a file browser listing is trusted before the directory's mtime is checked again
+LISTING_RECHECK_INTERVAL = 1.0
+
+# Directory item types for sorting the file browser
+DIRECTORY_TYPES = frozenset({'directory', 'hidden_directory', 'ignored_directory'})
+# Gitignored item types - listed dimmed, cannot be selected
+IGNORED_TYPES = frozenset({'ignored_file', 'ignored_directory'})
+
+def _path_sort_key(item: DirectoryItem) -> str:
+    """Case-insensitive name order"""
+    return item.path.lower()
+
+def sort_items(items: List[DirectoryItem], sort_mode: int) -> List[DirectoryItem]:
+    """Sort browser items: 0 dirs->files, 1 mixed (alphabetical), 2 files->dirs; parent always first"""
+    if not items:
+        return items
+
+    # One pass over the items into parent / directory / file buckets
+    parents, dirs, files = [], [], []
+    for item in items:
+        if item.type == 'parent':
+            parents.append(item)
+        elif item.type in DIRECTORY_TYPES:
+            dirs.append(item)
+        else:
+            files.append(item)
+
+    if sort_mode == 1:  # Mixed (alphabetical)
+        others = dirs + files
+        others.sort(key=_path_sort_key)
+        return parents + others
+
+    dirs.sort(key=_path_sort_key)
+    files.sort(key=_path_sort_key)
+    if sort_mode == 0:  # Directories first
+        return parents + dirs + files
+    return parents + files + dirs  # sort_mode == 2: Files first
+
+# Row styles parsed once at import - list rows pass Style objects so Rich skips style parsing
+STYLE_CURRENT = Style.parse(f"bold {MAT_BANANA}")
+STYLE_CURRENT_DIM = Style.parse(f"dim {MAT_BANANA}")
+STYLE_PRIMARY = Style.parse(MAT_PRIMARY)
+STYLE_SECONDARY = Style.parse(MAT_TEXT_SECONDARY)
+STYLE_DIM = Style.parse(f"dim {MAT_TEXT_SECONDARY}")
+STYLE_SEARCH_ACTIVE = Style.parse(f"bold {MAT_ACCENT}")
+
+# Controls lines of the list views' options sections - static, built once
+BROWSER_CONTROLS_LINE = Text.assemble(
+    ("Navigate ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("↑↓", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
+    ("FastScroll ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("PgUp/Dn", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
+    ("Open ", MAT_TEXT_HINT), ("[", MAT_ACCENT), ("Enter", MAT_ACCENT), ("]", MAT_ACCENT), ("  ", ""),
+    ("Select ", MAT_TEXT_HINT), ("[", MAT_ACCENT), ("Space", MAT_ACCENT), ("]", MAT_ACCENT), ("  ", ""),
+    ("Search ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_LIGHT), ("/", MAT_PRIMARY_LIGHT), ("]", MAT_PRIMARY_LIGHT), ("  ", ""),
+    ("Sort ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_LIGHT), ("s", MAT_PRIMARY_LIGHT), ("]", MAT_PRIMARY_LIGHT), ("  ", ""),
+    ("Add ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_DARK), ("Tab", MAT_PRIMARY_DARK), ("]", MAT_PRIMARY_DARK), ("  ", ""),
+    ("Exit ", MAT_TEXT_HINT), ("[", "#F44336"), ("q", "#F44336"), ("]", "#F44336")  # Material Red 500
+)
+
+# Keys the tracked / modified files views act on outside search mode (letters matched lowercased)
+TRACKED_KEYS = frozenset({
+    KeyCodes.ARROW_UP, KeyCodes.ARROW_DOWN, KeyCodes.PAGE_UP, KeyCodes.PAGE_DOWN,
+    KeyCodes.ENTER, KeyCodes.ESC, 'k', 'j', '/', 'q'
+})
+MODIFIED_KEYS = frozenset({
+    KeyCodes.ARROW_UP, KeyCodes.ARROW_DOWN, KeyCodes.PAGE_UP, KeyCodes.PAGE_DOWN,
+    KeyCodes.ESC, ' ', 'k', 'j', 'c', 'p', 'g', 'r', 'e', '/', 'q'
+})
+# Search mode editing keys besides printable characters
+SEARCH_KEYS = frozenset({KeyCodes.ENTER, KeyCodes.ESC, KeyCodes.BACKSPACE, '\b'})
+
+def _is_view_key(key: str, search_mode: bool, view_keys: frozenset) -> bool:
+    """Whether a list view reacts to key - any other key leaves the frame as it is"""
+    if search_mode:
+        return key in SEARCH_KEYS or (len(key) == 1 and key.isprintable())
+    return key in view_keys or key.lower() in view_keys
+
+# File browser sort mode labels with their colors, by sort mode
+BROWSER_SORT_LABELS = [("dirs→files", MAT_SORT_BLUE), ("mixed", MAT_SORT_ORANGE), ("files→dirs", MAT_SORT_GREEN)]
+
+_TRACKED_NAV_CONTROLS = [
+    ("Navigate ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("↑↓", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
+    ("FastScroll ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("PgUp/Dn", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
+    ("Search ", MAT_TEXT_HINT), ("[", MAT_ACCENT), ("/", MAT_ACCENT), ("]", MAT_ACCENT), ("  ", "")
+]
+_TRACKED_VIEW_CONTROLS = [("View History ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_LIGHT), ("Enter", MAT_PRIMARY_LIGHT), ("]", MAT_PRIMARY_LIGHT), ("  ", "")]
+_TRACKED_EXIT_CONTROLS = [("Exit ", MAT_TEXT_HINT), ("[", "#F44336"), ("q", "#F44336"), ("]", "#F44336")]
+TRACKED_CONTROLS_LINE = Text.assemble(*_TRACKED_NAV_CONTROLS, *_TRACKED_VIEW_CONTROLS, *_TRACKED_EXIT_CONTROLS)
+TRACKED_CONTROLS_LINE_EMPTY = Text.assemble(*_TRACKED_NAV_CONTROLS, *_TRACKED_EXIT_CONTROLS)
+
+# File browser row styles by item type (current and selected rows use STYLE_CURRENT)
+BROWSER_ITEM_STYLES = {
+    'directory': Style.parse(f"bold {MAT_DIR_NORMAL}"),         # Blue for directories
+    'hidden_directory': Style.parse(f"bold {MAT_DIR_HIDDEN}"),  # Light blue for hidden directories
+    'file': Style.parse(MAT_FILE_NORMAL),                       # Light gray for files
+    'hidden_file': Style.parse(MAT_FILE_HIDDEN),                # Gray for hidden files
+    'ignored_directory': STYLE_DIM,                             # Dimmed for gitignored items
+    'ignored_file': STYLE_DIM
+}
+
+@functools.lru_cache(maxsize=1024)
+def _fit_row_path(file_dir: str, file_name: str, available_width: int) -> Tuple[str, str]:
+    """List row (directory, name) shortened to available_width, directory '' if not shown"""
+    if file_dir and file_dir != ".":
+        # Truncate directory if too long
+        if len(file_dir) + 1 + len(file_name) > available_width:
+            return "..." + file_dir[-(available_width - len(file_name) - 10):], file_name
+        return file_dir, file_name
+
+    if len(file_name) > available_width:
+        return "", file_name[:available_width - 3] + "..."
+    return "", file_name
+
+# Search results a list view keeps per list before starting over
+FILTER_RESULTS_KEPT = 64
+
+class _FilterCache:
+    """Case-insensitive substring filter that remembers its recent results for one list"""
+
+    def __init__(self, key: Callable[[Any], str]):
+        self._key = key
+        self._source: Optional[list] = None
+        self._lowered: List[str] = []
+        self._joined = ""
+        self._offsets: List[int] = []
+        self._search = ""
+        self._matches: List[int] = []
+        self._result: list = []
+        # Earlier (matches, result) by search term, so backspacing and retyping reuse them
+        self._results: Dict[str, Tuple[List[int], list]] = {}
+
+    def filter(self, items: list, search: str) -> list:
+        """Items whose key contains search (same list object while nothing changed)"""
+        if not search:
+            return items
+
+        if items is not self._source:
+            # New list - lowercase its keys once
+            self._source = items
+            self._lowered = [self._key(item).lower() for item in items]
+            # All keys in one NUL separated buffer with each key's start offset (plus an end sentinel)
+            self._joined = "\0".join(self._lowered)
+            self._offsets = []
+            offset = 0
+            for key in self._lowered:
+                self._offsets.append(offset)
+                offset += len(key) + 1
+            self._offsets.append(offset)
+            self._search = ""
+            self._results = {}
+
+        if search != self._search:
+            cached = self._results.get(search)
+            if cached is not None:
+                self._matches, self._result = cached
+            else:
+                search_lower = search.lower()
+                lowered = self._lowered
+                # Typing narrows the search - only matches of the longest known prefix can still match
+                prefix = max((term for term in self._results if search.startswith(term)), key=len, default="")
+                if prefix:
+                    self._matches = [i for i in self._results[prefix][0] if search_lower in lowered[i]]
+                else:
+                    self._matches = self._scan(search_lower)
+                self._result = [items[i] for i in self._matches]
+
+                if len(self._results) >= FILTER_RESULTS_KEPT:
+                    self._results.clear()
+                self._results[search] = (self._matches, self._result)
+            self._search = search
+
+        return self._result
+
+    def _scan(self, search_lower: str) -> List[int]:
+        """Indexes of all keys containing search_lower, found with str.find over the joined buffer"""
+        joined, offsets = self._joined, self._offsets
+        matches = []
+        pos = joined.find(search_lower)
+        while pos != -1:
+            # Search terms hold no NUL, so a hit never spans two keys
+            i = bisect_right(offsets, pos) - 1
+            matches.append(i)
+            pos = joined.find(search_lower, offsets[i + 1])
+        return matches
+
 class RichUI(UIInterface):
     """Rich-based user interface implementation"""
 
     def __init__(self):
         self.console = console
         self._progress = None
+        self._dismiss_deadline = 0.0
+
+        # Terminal size as of a resize count, re-read after SIGWINCH instead of per keystroke
+        self._size: Optional[ConsoleDimensions] = None
+        self._size_seen = -1
+
+        # Main menu renderables never change - build them once instead of per keystroke
+        self._menu_header = Text(MAIN_MENU_HEADER, style=f"bold {MAT_ACCENT}", justify="center")
+        self._menu_footer_info = Text("💡 Tip: Use shortcuts [1-5] for quick navigation", style=MAT_TEXT_HINT, justify="center")
+        self._menu_footer_controls = Text("[↑↓]: navigate • [Enter]: select • [q]: quit", style=MAT_TEXT_SECONDARY, justify="center")
+        # Rendered main menu lines by selection, for the current terminal width
+        self._menu_frames: Dict[int, List[str]] = {}
+        self._menu_frames_width = 0
+        # Escape sequences that turn the frame of one selection into another's, by (from, to)
+        self._menu_updates: Dict[Tuple[int, int], str] = {}
+        # (selected, unselected) line per menu entry
+        self._menu_rows = [
+            (
+                Text(f"        ► [{num}] {title}", style="bold red" if num == "5" else f"bold {MAT_ACCENT}"),
+                Text(f"        · [{num}] {title}", style="dim white")
+            )
+            for num, title, _ in MAIN_MENU_OPTIONS
+        ]
 
     def initialize(self) -> bool:
         """Initialize the UI system"""
@@ -116,6 +449,25 @@ class RichUI(UIInterface):
         if self._progress:
             self.hide_progress()
 
+    def schedule_dismiss_after(self, seconds: float):
+        """Keep the current message on screen for at least `seconds` without blocking"""
+        self._dismiss_deadline = max(self._dismiss_deadline, time.monotonic() + seconds)
+
+    def _terminal_size(self) -> ConsoleDimensions:
+        """Console size, re-read only after a resize where SIGWINCH is available"""
+        if self._size is None or self._size_seen != _resize_count or not _watch_resize():
+            self._size_seen = _resize_count
+            self._size = self.console.size
+        return self._size
+
+    def _clear_screen(self):
+        """Clear the screen once any pending message dwell has elapsed"""
+        remaining = self._dismiss_deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._dismiss_deadline = 0.0
+        self.console.clear()
+
     def show_error(self, message: str):
         """Display error message"""
         self.console.print(f"[red]❌ {message}[/]")
@@ -132,25 +484,25 @@ class RichUI(UIInterface):
         """Show compact confirmation dialog"""
         default_text = "Yes" if default else "No"
 
-        while True:
-            # Compact confirmation panel
-            confirm_content = Group(
-                Text(message, style="white", justify="center"),
-                Text(""),
-                Text.assemble(
-                    ("(y) Yes  (n) No  ", "white"),
-                    (f"[Enter={default_text}]", MAT_TEXT_HINT)
-                )
+        # Compact confirmation panel, built once and reprinted after invalid keys
+        confirm_content = Group(
+            Text(message, style="white", justify="center"),
+            Text(""),
+            Text.assemble(
+                ("(y) Yes  (n) No  ", "white"),
+                (f"[Enter={default_text}]", MAT_TEXT_HINT)
             )
+        )
 
-            confirm_panel = Panel(
-                confirm_content,
-                title="❓ Confirm",
-                title_align="center",
-                border_style=MAT_ACCENT,
-                padding=(0, 1)
-            )
+        confirm_panel = Panel(
+            confirm_content,
+            title="❓ Confirm",
+            title_align="center",
+            border_style=MAT_ACCENT,
+            padding=(0, 1)
+        )
 
+        while True:
             self.console.print(confirm_panel)
 
             key = get_key()
@@ -185,78 +537,121 @@ class RichUI(UIInterface):
 
         self.console.print(header_panel)
 
-    def show_main_menu(self) -> str:
-        """Display main menu and return user choice"""
-        menu_options = [
-            ("1", "🐙  Browse Files", "Browse and add files to repository"),
-            ("2", "🍻  Modified Files", "View current changes and commit"),
-            ("3", "📋  Tracked Files", "List all tracked files"),
-            ("4", "🐒  Settings", "Configure paths and options"),
-            ("5", "💀  Exit", "Exit the dotfiles manager")
+    def _render_main_menu(self, current_selection: int) -> Panel:
+        """Build the main menu panel from the prebuilt lines"""
+        # Pick the prebuilt line for each entry
+        menu_lines = [
+            selected if i == current_selection else unselected
+            for i, (selected, unselected) in enumerate(self._menu_rows)
         ]
 
-        current_selection = 0
-
-        while True:
-            self.console.clear()
-
-            # Create menu lines
-            menu_lines = []
-            for i, (num, title, desc) in enumerate(menu_options):
-                if i == current_selection:
-                    if num == "5":  # Exit option
-                        menu_lines.append(Text(f"        ► [{num}] {title}", style="bold red"))
-                    else:
-                        menu_lines.append(Text(f"        ► [{num}] {title}", style=f"bold {MAT_ACCENT}"))
-                else:
-                    menu_lines.append(Text(f"        · [{num}] {title}", style="dim white"))
+        # Create complete menu content
+        menu_content = Group(
+            self._menu_header,
+            Text(""),
+            *menu_lines,
+            Text(""),
+            self._menu_footer_info,
+            self._menu_footer_controls
+        )
 
-            # Create header as a single centered block
-            header_ascii = """╔═══════════════════════════════════════╗
-║  🐉  D O T F I L E S   M A N A G E R  ║
-║    Manage your configuration files    ║
-╚═══════════════════════════════════════╝"""
+        return Panel(
+            menu_content,
+            style="#F8FFF8",
+            border_style=MAT_ACCENT,
+            box=box.ROUNDED,
+            padding=(1, 1)
+        )
 
-            header_content = [Text(header_ascii, style=f"bold {MAT_ACCENT}", justify="center")]
+    def _main_menu_frame(self, current_selection: int) -> List[str]:
+        """Rendered main menu lines for a selection, cached per terminal width"""
+        width = self._terminal_size().width
+        if self._menu_frames_width != width:
+            self._menu_frames = {}
+            self._menu_updates = {}
+            self._menu_frames_width = width
+
+        frame = self._menu_frames.get(current_selection)
+        if frame is None:
+            with self.console.capture() as capture:
+                self.console.print(self._render_main_menu(current_selection))
+            frame = self._menu_frames[current_selection] = capture.get().splitlines()
+        return frame
+
+    def _main_menu_update(self, old_selection: int, new_selection: int) -> str:
+        """Output that rewrites only the lines differing between two selections' frames (cached)"""
+        old_frame = self._main_menu_frame(old_selection)
+        new_frame = self._main_menu_frame(new_selection)
+        update = self._menu_updates.get((old_selection, new_selection))
+        if update is None:
+            # Cursor sits below the menu: hop up to each changed line, rewrite it, hop back
+            height = len(new_frame)
+            update = self._menu_updates[(old_selection, new_selection)] = ''.join(
+                f"\x1b[{height - i}A\r{line}\x1b[{height - i}B\r"
+                for i, (old, line) in enumerate(zip(old_frame, new_frame))
+                if old != line
+            )
+        return update
+
+    @contextmanager
+    def _main_menu_display(self, current_selection: int):
+        """Show the main menu and yield a redraw(selection) that rewrites only the lines that changed"""
+        if not self.console.is_terminal:
+            # No cursor control - let Live reprint the panel
+            with Live(self._render_main_menu(current_selection), console=self.console, auto_refresh=False) as live:
+                yield lambda selection: live.update(self._render_main_menu(selection), refresh=True)
+            return
+
+        out = self.console.file
+        shown = {'selection': current_selection, 'frame': self._main_menu_frame(current_selection), 'size': self._terminal_size()}
+
+        def redraw(selection: int):
+            frame = self._main_menu_frame(selection)
+            size = self._terminal_size()
+            if size != shown['size'] or len(frame) != len(shown['frame']) or len(frame) >= size.height:
+                # Resized (or taller than the screen) - full repaint
+                self.console.clear()
+                out.write("\n".join(frame) + "\n")
+            else:
+                out.write(self._main_menu_update(shown['selection'], selection))
+            out.flush()
+            shown['selection'], shown['frame'], shown['size'] = selection, frame, size
 
-            # Create footer with helpful information
-            footer_info = Text("💡 Tip: Use shortcuts [1-5] for quick navigation", style=MAT_TEXT_HINT, justify="center")
-            footer_controls = Text("[↑↓]: navigate • [Enter]: select • [q]: quit", style=MAT_TEXT_SECONDARY, justify="center")
+        self.console.show_cursor(False)
+        try:
+            out.write("\n".join(shown['frame']) + "\n")
+            out.flush()
+            yield redraw
+        finally:
+            self.console.show_cursor(True)
 
-            # Create complete menu content
-            menu_content = Group(
-                *header_content,
-                Text(""),
-                *menu_lines,
-                Text(""),
-                footer_info,
-                footer_controls
-            )
+    def show_main_menu(self) -> str:
+        """Display main menu and return user choice"""
+        menu_count = len(self._menu_rows)
+        current_selection = 0
 
-            # Display menu panel
-            menu_panel = Panel(
-                menu_content,
-                style="#F8FFF8",
-                border_style=MAT_ACCENT,
-                box=box.ROUNDED,
-                padding=(1, 1)
-            )
+        self._clear_screen()
 
-            self.console.print(menu_panel)
+        # Redraw in place on navigation instead of clearing and reprinting the whole screen
+        with raw_stdin(), self._main_menu_display(current_selection) as redraw:
+            while True:
+                # Get user input
+                key = get_key()
 
-            # Get user input
-            key = get_key()
+                if key == KeyCodes.ARROW_UP or key.lower() == 'k':
+                    current_selection = (current_selection - 1) % menu_count
+                elif key == KeyCodes.ARROW_DOWN or key.lower() == 'j':
+                    current_selection = (current_selection + 1) % menu_count
+                elif key == KeyCodes.ENTER or key == '\n':
+                    return str(current_selection + 1)
+                elif key.lower() == 'q' or key == KeyCodes.ESC:
+                    return "5"  # Exit
+                elif key in ['1', '2', '3', '4', '5']:  # Direct selection
+                    return key
+                else:
+                    continue
 
-            if key == KeyCodes.ARROW_UP or key.lower() == 'k':
-                current_selection = (current_selection - 1) % len(menu_options)
-            elif key == KeyCodes.ARROW_DOWN or key.lower() == 'j':
-                current_selection = (current_selection + 1) % len(menu_options)
-            elif key == KeyCodes.ENTER or key == '\n':
-                return str(current_selection + 1)
-            elif key.lower() == 'q' or key == KeyCodes.ESC:
-                return "5"  # Exit
-            elif key in ['1', '2', '3', '4', '5']:  # Direct selection
-                return key
+                redraw(current_selection)
 
     def show_file_browser(self, start_directory: str = "~") -> List[str]:
         """Enhanced file browser with Material Design colors, single-column layout, and sort functionality"""
@@ -269,7 +664,8 @@ class RichUI(UIInterface):
         file_manager = FileManager(config_manager)
 
         current_dir = os.path.expanduser(start_directory)
-        selected_items = set()
+        # Selected paths in selection order (passed on to git add in that order) -> checkbox mark
+        selected_items: Dict[str, str] = {}
         current_selection = 0
         scroll_offset_row = 0
         last_items = []
@@ -279,281 +675,250 @@ class RichUI(UIInterface):
         last_terminal_size = None
         sort_mode = 0  # 0: dirs->files, 1: mixed (alphabetical), 2: files->dirs
 
-        def sort_items(items, sort_mode):
-            """Sort items based on sort mode"""
-            if not items:
-                return items
-
-            # Always keep parent directory at the top
-            parent_items = [item for item in items if item.type == 'parent']
-            other_items = [item for item in items if item.type != 'parent']
-
-            if sort_mode == 0:  # Directories first
-                dirs = [item for item in other_items if item.type in ['directory', 'hidden_directory']]
-                files = [item for item in other_items if item.type in ['file', 'hidden_file']]
-                dirs.sort(key=lambda x: x.path.lower())
-                files.sort(key=lambda x: x.path.lower())
-                return parent_items + dirs + files
-            elif sort_mode == 1:  # Mixed (alphabetical)
-                other_items.sort(key=lambda x: x.path.lower())
-                return parent_items + other_items
-            else:  # sort_mode == 2: Files first
-                files = [item for item in other_items if item.type in ['file', 'hidden_file']]
-                dirs = [item for item in other_items if item.type in ['directory', 'hidden_directory']]
-                files.sort(key=lambda x: x.path.lower())
-                dirs.sort(key=lambda x: x.path.lower())
-                return parent_items + files + dirs
-
-        def filter_items(items, search):
-            """Filter items based on search term"""
-            if not search:
-                return items
-            search_lower = search.lower()
-            return [item for item in items if search_lower in item.path.lower()]
+        # Directory listing as ((directory, mtime), items) and its sorted views by sort mode;
+        # navigation keys reuse them, the directory is re-scanned only when it changes
+        listing: Optional[tuple] = None
+        sorted_views: Dict[int, List[DirectoryItem]] = {}
+        # When the shown directory's mtime was last checked
+        listing_checked = 0.0
+
+        # Filter results are reused until the search term or the sorted view changes
+        filter_items = _FilterCache(lambda item: item.path).filter
 
         def create_compact_options_section(sort_mode, selected_count, items_count):
             """Create a compact options section with Material Design colors"""
-            sort_modes = ["dirs→files", "mixed", "files→dirs"]
-
-            # Material design controls line with consistent colors
-            controls_line = Text.assemble(
-                ("Navigate ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("↑↓", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
-                ("FastScroll ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("PgUp/Dn", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
-                ("Open ", MAT_TEXT_HINT), ("[", MAT_ACCENT), ("Enter", MAT_ACCENT), ("]", MAT_ACCENT), ("  ", ""),
-                ("Select ", MAT_TEXT_HINT), ("[", MAT_ACCENT), ("Space", MAT_ACCENT), ("]", MAT_ACCENT), ("  ", ""),
-                ("Search ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_LIGHT), ("/", MAT_PRIMARY_LIGHT), ("]", MAT_PRIMARY_LIGHT), ("  ", ""),
-                ("Sort ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_LIGHT), ("s", MAT_PRIMARY_LIGHT), ("]", MAT_PRIMARY_LIGHT), ("  ", ""),
-                ("Add ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_DARK), ("Tab", MAT_PRIMARY_DARK), ("]", MAT_PRIMARY_DARK), ("  ", ""),
-                ("Exit ", MAT_TEXT_HINT), ("[", "#F44336"), ("q", "#F44336"), ("]", "#F44336")  # Material Red 500
-            )
-
-            # Material status line
-            sort_colors = [MAT_SORT_BLUE, MAT_SORT_ORANGE, MAT_SORT_GREEN]
+            # Only the status line has live data; the controls line is prebuilt
             status_line = Text.assemble(
                 ("Selected ", MAT_TEXT_HINT), (f"{selected_count}", MAT_PRIMARY),
                 (" • Total ", MAT_TEXT_HINT), (f"{items_count}", MAT_PRIMARY),
-                (" • Sort ", MAT_TEXT_HINT), (sort_modes[sort_mode], sort_colors[sort_mode])
+                (" • Sort ", MAT_TEXT_HINT), BROWSER_SORT_LABELS[sort_mode]
             )
 
-            return [controls_line, status_line]
-
-        while True:
-            all_items = file_manager.get_directory_contents(current_dir)
-            sorted_items = sort_items(all_items, sort_mode)
-            items = filter_items(sorted_items, search_term)
-
-            # Get terminal size
-            terminal_size = self.console.size
-            terminal_height = terminal_size.height
+            return [BROWSER_CONTROLS_LINE, status_line]
 
-            # Calculate visible area (always available for navigation)
-            visible_height = max(1, terminal_height - 15)
-            visible_rows = visible_height
+        self._clear_screen()
 
-            # Only refresh if items changed, terminal resized, or explicit refresh needed
-            terminal_changed = last_terminal_size != terminal_size
-            items_changed = items != last_items
+        # One panel for the whole session - each frame swaps its content and title
+        panel_content = Group()
+        panel = Panel(panel_content, title_align="left", border_style=MAT_ACCENT, padding=(0, 1))
 
-            if items_changed or need_refresh or terminal_changed:
-                last_items = items[:]
-                last_terminal_size = terminal_size
-                need_refresh = False
+        # Redraw frames in place instead of clearing and reprinting the whole screen
+        with raw_stdin(), Live(console=self.console, auto_refresh=False) as live:
+            while True:
+                # Stat the directory only after entering it or once the last check is
+                # LISTING_RECHECK_INTERVAL old - held or typed keys reuse the listing as is
+                now = time.monotonic()
+                if listing is None or listing[0][0] != current_dir or now - listing_checked >= LISTING_RECHECK_INTERVAL:
+                    listing_checked = now
+                    try:
+                        listing_key = (current_dir, os.stat(current_dir).st_mtime_ns)
+                    except OSError:
+                        listing_key = (current_dir, None)
+
+                    if listing is None or listing[0] != listing_key:
+                        listing = (listing_key, file_manager.get_directory_contents(current_dir))
+                        sorted_views.clear()
+                all_items = listing[1]
+
+                sorted_items = sorted_views.get(sort_mode)
+                if sorted_items is None:
+                    sorted_items = sorted_views[sort_mode] = sort_items(all_items, sort_mode)
+                items = filter_items(sorted_items, search_term)
+
+                # Get terminal size
+                terminal_size = self._terminal_size()
+                terminal_height = terminal_size.height
+
+                # Calculate visible area (always available for navigation)
+                visible_height = max(1, terminal_height - 15)
+                visible_rows = visible_height
+
+                # Only refresh if items changed, terminal resized, or explicit refresh needed
+                terminal_changed = last_terminal_size != terminal_size
+                # Listing, sort and filter results are cached, so a new list object means new items
+                # (a re-scan of an unchanged directory costs one redraw, not an element-wise compare)
+                items_changed = items is not last_items
+
+                if items_changed or need_refresh or terminal_changed:
+                    last_items = items
+                    last_terminal_size = terminal_size
+                    need_refresh = False
+
+                    # Ensure current_selection is within bounds
+                    if current_selection >= len(items):
+                        current_selection = len(items) - 1 if items else 0
+
+                    # Single-column layout
+                    columns = 1
+                    max_item_width = (terminal_size.width - 10) // columns
+
+                    # Calculate current row and column
+                    if items:
+                        current_row = current_selection // columns
 
-                # Ensure current_selection is within bounds
-                if current_selection >= len(items):
-                    current_selection = len(items) - 1 if items else 0
-
-                # Single-column layout
-                columns = 1
-                max_item_width = (terminal_size.width - 10) // columns
-
-                # Calculate current row and column
-                if items:
-                    current_row = current_selection // columns
-
-                    # Adjust vertical scroll offset to keep current selection visible
-                    if current_row < scroll_offset_row:
-                        scroll_offset_row = current_row
-                    elif current_row >= scroll_offset_row + visible_rows:
-                        scroll_offset_row = current_row - visible_rows + 1
-                else:
-                    current_row = 0
+                        # Adjust vertical scroll offset to keep current selection visible
+                        if current_row < scroll_offset_row:
+                            scroll_offset_row = current_row
+                        elif current_row >= scroll_offset_row + visible_rows:
+                            scroll_offset_row = current_row - visible_rows + 1
+                    else:
+                        current_row = 0
 
-                # Prepare file list content
-                file_content = []
+                    # Prepare file list content
+                    file_content = []
 
-                if not items:
-                    file_content.append(Text("Empty directory or no accessible items", style="red"))
-                else:
-                    # Create single column layout
-                    for row in range(visible_rows):
-                        actual_row = row + scroll_offset_row
+                    if not items:
+                        file_content.append(Text("Empty directory or no accessible items", style="red"))
+                    else:
+                        # Create single column layout
+                        name_limit = max_item_width - 8
+                        for row, item in enumerate(items[scroll_offset_row:scroll_offset_row + visible_rows]):
+                            actual_row = row + scroll_offset_row
 
-                        if actual_row < len(items):
-                            item = items[actual_row]
-                            item_path = item.full_path if item.type != 'parent' else item.path
                             item_type = item.type
+                            is_parent = item_type == 'parent'
+                            item_path = item.path if is_parent else item.full_path
                             display_name = item.path
 
                             # Truncate long names
-                            if len(display_name) > max_item_width - 8:
+                            if len(display_name) > name_limit:
                                 display_name = display_name[:max_item_width - 11] + "..."
 
                             # Show banana for selected files, space for others
-                            if item_type == 'parent':
-                                checkbox = " "
+                            is_selected = not is_parent and item_path in selected_items
+                            checkbox = " " if is_parent else selected_items.get(item_path, "　")
+
+                            # Current selection and selected items in banana color, others by type
+                            prefix = "►" if actual_row == current_selection else " "
+                            if prefix == "►":
+                                style = STYLE_CURRENT_DIM if item_type in IGNORED_TYPES else STYLE_CURRENT
+                            elif is_selected:
+                                style = STYLE_CURRENT
                             else:
-                                checkbox = "🍌" if item_path in selected_items else "　"
-
-                            # Highlight current selection
-                            is_current = actual_row == current_selection
-
-                            if is_current:
-                                style = f"bold {MAT_BANANA}"  # Current selection in banana color
-                                prefix = "►"
-                            elif item_path in selected_items and item_type != 'parent':
-                                style = f"bold {MAT_BANANA}"  # Selected items in banana color
-                                prefix = " "
-                            else:
-                                # Apply new color scheme based on item type
-                                if item_type == 'directory':
-                                    style = f"bold {MAT_DIR_NORMAL}"  # Blue for directories
-                                elif item_type == 'hidden_directory':
-                                    style = f"bold {MAT_DIR_HIDDEN}"  # Light blue for hidden directories
-                                elif item_type == 'file':
-                                    style = MAT_FILE_NORMAL  # Light gray for files
-                                elif item_type == 'hidden_file':
-                                    style = MAT_FILE_HIDDEN  # Gray for hidden files
-                                else:
-                                    style = MAT_TEXT_SECONDARY
-                                prefix = " "
+                                style = BROWSER_ITEM_STYLES.get(item_type, STYLE_SECONDARY)
 
                             # Format item with fixed width (no icon)
                             item_display = f"{prefix}{checkbox} {display_name}"
                             item_display = item_display.ljust(max_item_width)
                             file_content.append(Text(item_display, style=style))
 
-                    # Add scroll indicator if needed
-                    total_rows = len(items)
-                    if total_rows > visible_rows:
-                        file_content.append(Text(""))  # Empty line
-                        scroll_info = Text(f"Showing rows {scroll_offset_row + 1}-{min(scroll_offset_row + visible_rows, total_rows)} of {total_rows}", style=MAT_TEXT_HINT)
-                        file_content.append(scroll_info)
-
-                # Add search line with material colors
-                if search_mode:
-                    search_display = f"Search: {search_term}_"
-                    search_style = f"bold {MAT_ACCENT}"
-                elif search_term:
-                    search_display = f"Filter: {search_term} (showing {len(items)}/{len(all_items)})"
-                    search_style = MAT_PRIMARY
-                else:
-                    search_display = "Press / to search"
-                    search_style = MAT_TEXT_HINT
-
-                file_content.append(Text(""))  # Empty line
-                file_content.append(Text(search_display, style=search_style))
+                        # Add scroll indicator if needed
+                        total_rows = len(items)
+                        if total_rows > visible_rows:
+                            file_content.append(Text(""))  # Empty line
+                            scroll_info = Text(f"Showing rows {scroll_offset_row + 1}-{min(scroll_offset_row + visible_rows, total_rows)} of {total_rows}", style=MAT_TEXT_HINT)
+                            file_content.append(scroll_info)
+
+                    # Add search line with material colors
+                    if search_mode:
+                        search_display = f"Search: {search_term}_"
+                        search_style = STYLE_SEARCH_ACTIVE
+                    elif search_term:
+                        search_display = f"Filter: {search_term} (showing {len(items)}/{len(all_items)})"
+                        search_style = MAT_PRIMARY
+                    else:
+                        search_display = "Press / to search"
+                        search_style = MAT_TEXT_HINT
 
-                # Header with current directory
-                current_dir_display = current_dir.replace(os.path.expanduser('~'), '~')
+                    file_content.append(Text(""))  # Empty line
+                    file_content.append(Text(search_display, style=search_style))
 
-                # Clear screen and display panel
-                self.console.clear()
+                    # Header with current directory
+                    current_dir_display = current_dir.replace(os.path.expanduser('~'), '~')
 
-                # Add compact options at the bottom
-                options_lines = create_compact_options_section(sort_mode, len(selected_items), len(items))
+                    # Add compact options at the bottom
+                    options_lines = create_compact_options_section(sort_mode, len(selected_items), len(items))
 
-                # Add separator and options to file content with material colors
-                file_content.append(Text(""))
-                file_content.append(Text("─" * 60, style=MAT_TEXT_HINT))
-                file_content.extend(options_lines)
+                    # Add separator and options to file content with material colors
+                    file_content.append(Text(""))
+                    file_content.append(Text("─" * 60, style=MAT_TEXT_HINT))
+                    file_content.extend(options_lines)
 
-                self.console.print(Panel(
-                    Group(*file_content),
-                    title=f"📁 FILE BROWSER - {current_dir_display}",
-                    title_align="left",
-                    border_style=MAT_ACCENT,
-                    padding=(0, 1)
-                ))
+                    # Refill the panel built before the loop
+                    panel_content.renderables[:] = file_content
+                    panel.title = f"📁 FILE BROWSER - {current_dir_display}"
+                    live.update(panel, refresh=True)
 
-            # Handle input
-            key = get_key()
+                # Handle input
+                key = get_key()
 
-            if search_mode:
-                # Search mode input handling
-                if key == KeyCodes.ENTER or key == '\n':
-                    # Confirm search (Enter key)
-                    search_mode = False
-                    need_refresh = True
-                elif key == KeyCodes.ESC:
-                    # Cancel search (Escape key)
-                    search_mode = False
-                    search_term = ""
-                    need_refresh = True
-                elif key == KeyCodes.BACKSPACE or key == '\b':
-                    # Remove character from search (Backspace key)
-                    if search_term:
-                        search_term = search_term[:-1]
-                        need_refresh = True
-                elif len(key) == 1 and key.isprintable():
-                    # Add character to search term (printable characters)
-                    search_term += key
-                    current_selection = 0  # Reset selection when searching
-                    need_refresh = True
-            else:
-                # Normal navigation mode
-                if key == KeyCodes.ARROW_UP or key.lower() == 'k':
-                    # Navigate up in single column (Arrow Up or K key)
-                    if items:
-                        current_selection = (current_selection - 1) % len(items)
-                        need_refresh = True
-                elif key == KeyCodes.ARROW_DOWN or key.lower() == 'j':
-                    # Navigate down in single column (Arrow Down or J key)
-                    if items:
-                        current_selection = (current_selection + 1) % len(items)
+                if search_mode:
+                    # Search mode input handling
+                    if key == KeyCodes.ENTER or key == '\n':
+                        # Confirm search (Enter key)
+                        search_mode = False
                         need_refresh = True
-                elif key == KeyCodes.PAGE_UP:
-                    # Page up navigation
-                    if items:
-                        current_selection = max(0, current_selection - visible_rows)
+                    elif key == KeyCodes.ESC:
+                        # Cancel search (Escape key)
+                        search_mode = False
+                        search_term = ""
                         need_refresh = True
-                elif key == KeyCodes.PAGE_DOWN:
-                    # Page down navigation
-                    if items:
-                        current_selection = min(len(items) - 1, current_selection + visible_rows)
+                    elif key == KeyCodes.BACKSPACE or key == '\b':
+                        # Remove character from search (Backspace key)
+                        if search_term:
+                            search_term = search_term[:-1]
+                            need_refresh = True
+                    elif len(key) == 1 and key.isprintable():
+                        # Add character to search term (printable characters), with the rest of a paste
+                        search_term += key + ''.join(take_queued_keys(_is_printable_key))
+                        current_selection = 0  # Reset selection when searching
                         need_refresh = True
-                elif key == KeyCodes.ENTER or key == '\n':
-                    # Enter directory or select file (Enter key)
-                    if items and current_selection < len(items):
-                        current_item = items[current_selection]
-                        if current_item.type in ['directory', 'hidden_directory', 'parent']:
-                            current_dir = current_item.full_path
-                            current_selection = 0
-                            scroll_offset_row = 0
-                            search_term = ""  # Clear search when navigating
+                else:
+                    # Normal navigation mode
+                    if key == KeyCodes.ARROW_UP or key.lower() == 'k':
+                        # Navigate up in single column (Arrow Up or K key), a held key in one step
+                        steps = 1 + len(take_queued_keys(key.__eq__))
+                        if items:
+                            current_selection = (current_selection - steps) % len(items)
                             need_refresh = True
-                elif key == ' ':  # Space - toggle selection (not for parent dir)
-                    if items and current_selection < len(items):
-                        current_item = items[current_selection]
-                        if current_item.type != 'parent':
-                            item_path = current_item.full_path
-                            if item_path in selected_items:
-                                selected_items.remove(item_path)
-                            else:
-                                selected_items.add(item_path)
+                    elif key == KeyCodes.ARROW_DOWN or key.lower() == 'j':
+                        # Navigate down in single column (Arrow Down or J key), a held key in one step
+                        steps = 1 + len(take_queued_keys(key.__eq__))
+                        if items:
+                            current_selection = (current_selection + steps) % len(items)
                             need_refresh = True
-                elif key == '/':  # Start search
-                    search_mode = True
-                    search_term = ""
-                    need_refresh = True
-                elif key == '\t':  # Tab - confirm selection and add to git
-                    return list(selected_items)
-                elif key.lower() == 's':  # Sort mode toggle
-                    sort_mode = (sort_mode + 1) % 3
-                    need_refresh = True
-                elif key.lower() == 'q' or key == KeyCodes.ESC:
-                    # Quit file browser (Q key or Escape)
-                    return []
+                    elif key == KeyCodes.PAGE_UP:
+                        # Page up navigation
+                        if items:
+                            current_selection = max(0, current_selection - visible_rows)
+                            need_refresh = True
+                    elif key == KeyCodes.PAGE_DOWN:
+                        # Page down navigation
+                        if items:
+                            current_selection = min(len(items) - 1, current_selection + visible_rows)
+                            need_refresh = True
+                    elif key == KeyCodes.ENTER or key == '\n':
+                        # Enter directory or select file (Enter key)
+                        if items and current_selection < len(items):
+                            current_item = items[current_selection]
+                            if current_item.type in DIRECTORY_TYPES or current_item.type == 'parent':
+                                current_dir = current_item.full_path
+                                current_selection = 0
+                                scroll_offset_row = 0
+                                search_term = ""  # Clear search when navigating
+                                need_refresh = True
+                    elif key == ' ':  # Space - toggle selection (not for parent dir or gitignored items)
+                        if items and current_selection < len(items):
+                            current_item = items[current_selection]
+                            if current_item.type != 'parent' and current_item.type not in IGNORED_TYPES:
+                                item_path = current_item.full_path
+                                if item_path in selected_items:
+                                    del selected_items[item_path]
+                                else:
+                                    selected_items[item_path] = "🍌"
+                                need_refresh = True
+                    elif key == '/':  # Start search
+                        search_mode = True
+                        search_term = ""
+                        need_refresh = True
+                    elif key == '\t':  # Tab - confirm selection and add to git
+                        return list(selected_items)
+                    elif key.lower() == 's':  # Sort mode toggle
+                        sort_mode = (sort_mode + 1) % 3
+                        need_refresh = True
+                    elif key.lower() == 'q' or key == KeyCodes.ESC:
+                        # Quit file browser (Q key or Escape)
+                        return []
 
     def show_directory_contents(self, items: List[DirectoryItem], current_dir: str) -> Optional[str]:
         """Display directory contents and return selected action"""
@@ -567,39 +932,13 @@ class RichUI(UIInterface):
         search_term = ""
         search_mode = False
 
-        def filter_files(files_list, search):
-            """Filter files based on search term"""
-            if not search:
-                return files_list
-
-            search_lower = search.lower()
-            filtered = []
-
-            for file_info in files_list:
-                # Search in file path
-                if search_lower in file_info.path.lower():
-                    filtered.append(file_info)
-
-            return filtered
+        # Search in file path, lowercased once per file list
+        filter_files = _FilterCache(lambda file_info: file_info.path).filter
 
         def create_compact_options_section(total_count, has_files):
             """Create compact options section for tracked files"""
-
-            # Basic controls always available
-            controls = [
-                ("Navigate ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("↑↓", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
-                ("FastScroll ", MAT_TEXT_HINT), ("[", MAT_PRIMARY), ("PgUp/Dn", MAT_PRIMARY), ("]", MAT_PRIMARY), ("  ", ""),
-                ("Search ", MAT_TEXT_HINT), ("[", MAT_ACCENT), ("/", MAT_ACCENT), ("]", MAT_ACCENT), ("  ", "")
-            ]
-
-            # Add view control if there are files
-            if has_files:
-                controls.extend([("View History ", MAT_TEXT_HINT), ("[", MAT_PRIMARY_LIGHT), ("Enter", MAT_PRIMARY_LIGHT), ("]", MAT_PRIMARY_LIGHT), ("  ", "")])
-
-            # Exit always available
-            controls.extend([("Exit ", MAT_TEXT_HINT), ("[", "#F44336"), ("q", "#F44336"), ("]", "#F44336")])
-
-            controls_line = Text.assemble(*controls)
+            # View History is only offered when there are files; both controls lines are prebuilt
+            controls_line = TRACKED_CONTROLS_LINE if has_files else TRACKED_CONTROLS_LINE_EMPTY
 
             status_line = Text.assemble(
                 ("Total ", MAT_TEXT_HINT), (f"{total_count}", MAT_PRIMARY),
@@ -608,211 +947,224 @@ class RichUI(UIInterface):
 
             return [controls_line, status_line]
 
-        while True:
-            self.console.clear()
+        # Display fields by path as (directory, name, size, mtime), computed once per file
+        file_details: Dict[str, Tuple[str, str, str, str]] = {}
 
-            # Get terminal size for scrolling
-            terminal_size = self.console.size
-            terminal_height = terminal_size.height
+        def build_row(file_path, is_current, width):
+            """Build the Text of one file row"""
+            file_dir, file_name, size_str, mtime_str = file_details[file_path]
 
-            # Calculate available space for table
-            visible_height = max(1, terminal_height - 17)  # Extra space for search line
+            # Row styling
+            if is_current:
+                prefix = "►"
+                base_style = STYLE_CURRENT
+                filename_style = STYLE_CURRENT
+                dir_style = STYLE_CURRENT_DIM
+                info_style = STYLE_CURRENT_DIM
+            else:
+                prefix = " "
+                base_style = STYLE_PRIMARY
+                filename_style = STYLE_PRIMARY
+                dir_style = STYLE_DIM
+                info_style = STYLE_DIM
+
+            # Calculate available width for file path
+            available_width = width - 30  # Reserve space for info
+
+            # Format file path elegantly
+            display_dir, display_name = _fit_row_path(file_dir, file_name, available_width)
+            if display_dir:
+                # Show directory in dim style + filename in normal
+                file_text = Text.assemble(
+                    (f"{prefix} ", base_style),
+                    (display_dir + "/", dir_style),
+                    (display_name, filename_style),
+                    (f" • {size_str} • {mtime_str}", info_style)
+                )
+            else:
+                # Just filename
+                file_text = Text.assemble(
+                    (f"{prefix} ", base_style),
+                    (display_name, filename_style),
+                    (f" • {size_str} • {mtime_str}", info_style)
+                )
 
-            # Apply search filter
-            filtered_files = filter_files(files, search_term)
+            return file_text
 
-            file_content = []
+        # Row Texts by (path, is current row) for the current width - a navigation
+        # key rebuilds only the rows whose current marker moved
+        row_cache: Dict[tuple, Text] = {}
+        row_cache_width = 0
 
-            # Add search line with material colors
-            if search_mode:
-                search_display = f"Search: {search_term}_"
-                search_style = f"bold {MAT_ACCENT}"
-            elif search_term:
-                search_display = f"Filter: {search_term} (showing {len(filtered_files)}/{len(files)})"
-                search_style = MAT_PRIMARY
-            else:
-                search_display = "Press '/' to search"
-                search_style = MAT_TEXT_HINT
+        self._clear_screen()
 
-            search_line = Text(search_display, style=search_style)
-            file_content.append(search_line)
-            file_content.append(Text(""))  # Empty line for spacing
+        # One panel for the whole session - each frame swaps its content
+        panel_content = Group()
+        panel = Panel(panel_content, title="📋 TRACKED FILES", title_align="left", border_style=MAT_ACCENT, padding=(0, 1))
 
-            if not filtered_files:
-                if search_term:
-                    file_content.append(Text("No files found with search term", style=f"{MAT_PRIMARY}"))
-                    file_content.append(Text(f"Search among {len(files)} tracked files", style=f"{MAT_TEXT_SECONDARY}"))
-                else:
-                    file_content.append(Text("No files tracked in repository", style=f"{MAT_PRIMARY}"))
-                    file_content.append(Text("Use 'Browse Files' to add files to repository", style=f"{MAT_TEXT_SECONDARY}"))
-            else:
-                # Ensure current_selection is within bounds
-                if current_selection >= len(filtered_files):
-                    current_selection = len(filtered_files) - 1 if filtered_files else 0
+        # Redraw frames in place instead of clearing and reprinting the whole screen
+        with raw_stdin(), Live(console=self.console, auto_refresh=False) as live:
+            while True:
+                # Get terminal size for scrolling
+                terminal_size = self._terminal_size()
+                terminal_height = terminal_size.height
 
-                # Adjust scroll offset to keep current selection visible
-                current_row = current_selection
-                if current_row < scroll_offset:
-                    scroll_offset = current_row
-                elif current_row >= scroll_offset + visible_height:
-                    scroll_offset = current_row - visible_height + 1
+                # Calculate available space for table
+                visible_height = max(1, terminal_height - 17)  # Extra space for search line
 
-                from ..common import format_file_size, format_file_mtime
+                # Apply search filter
+                filtered_files = filter_files(files, search_term)
 
-                # Display visible rows with elegant formatting
-                for row in range(visible_height):
-                    actual_row = row + scroll_offset
-
-                    if actual_row < len(filtered_files):
-                        file_info = filtered_files[actual_row]
-
-                        # File info
-                        file_path = file_info.path
-                        file_name = os.path.basename(file_path)
-                        file_dir = os.path.dirname(file_path)
-
-                        # Selection and current indicators
-                        is_current = actual_row == current_selection
-
-                        # Row styling
-                        if is_current:
-                            prefix = "►"
-                            base_style = f"bold {MAT_BANANA}"
-                            filename_style = f"bold {MAT_BANANA}"
-                            dir_style = f"dim {MAT_BANANA}"
-                            info_style = f"dim {MAT_BANANA}"
-                        else:
-                            prefix = " "
-                            base_style = MAT_PRIMARY
-                            filename_style = MAT_PRIMARY
-                            dir_style = f"dim {MAT_TEXT_SECONDARY}"
-                            info_style = f"dim {MAT_TEXT_SECONDARY}"
-
-                        # Format file info
-                        size_str = format_file_size(file_info.size)
-                        mtime_str = format_file_mtime(file_info.mtime)
-
-                        # Calculate available width for file path
-                        available_width = terminal_size.width - 30  # Reserve space for info
-
-                        # Format file path elegantly
-                        if file_dir and file_dir != ".":
-                            # Show directory in dim style + filename in normal
-                            if len(file_path) > available_width:
-                                # Truncate directory if too long
-                                truncated_dir = "..." + file_dir[-(available_width - len(file_name) - 10):]
-                                display_path = f"{truncated_dir}/{file_name}"
-                            else:
-                                display_path = file_path
+                file_content = []
 
-                            file_text = Text.assemble(
-                                (f"{prefix} ", base_style),
-                                (os.path.dirname(display_path) + "/", dir_style),
-                                (os.path.basename(display_path), filename_style),
-                                (f" • {size_str} • {mtime_str}", info_style)
-                            )
-                        else:
-                            # Just filename
-                            if len(file_name) > available_width:
-                                display_name = file_name[:available_width - 3] + "..."
-                            else:
-                                display_name = file_name
+                # Add search line with material colors
+                if search_mode:
+                    search_display = f"Search: {search_term}_"
+                    search_style = STYLE_SEARCH_ACTIVE
+                elif search_term:
+                    search_display = f"Filter: {search_term} (showing {len(filtered_files)}/{len(files)})"
+                    search_style = MAT_PRIMARY
+                else:
+                    search_display = "Press '/' to search"
+                    search_style = MAT_TEXT_HINT
 
-                            file_text = Text.assemble(
-                                (f"{prefix} ", base_style),
-                                (display_name, filename_style),
-                                (f" • {size_str} • {mtime_str}", info_style)
-                            )
+                search_line = Text(search_display, style=search_style)
+                file_content.append(search_line)
+                file_content.append(Text(""))  # Empty line for spacing
 
-                        file_content.append(file_text)
+                if not filtered_files:
+                    if search_term:
+                        file_content.append(Text("No files found with search term", style=MAT_PRIMARY))
+                        file_content.append(Text(f"Search among {len(files)} tracked files", style=MAT_TEXT_SECONDARY))
+                    else:
+                        file_content.append(Text("No files tracked in repository", style=MAT_PRIMARY))
+                        file_content.append(Text("Use 'Browse Files' to add files to repository", style=MAT_TEXT_SECONDARY))
+                else:
+                    # Ensure current_selection is within bounds
+                    if current_selection >= len(filtered_files):
+                        current_selection = len(filtered_files) - 1 if filtered_files else 0
+
+                    # Adjust scroll offset to keep current selection visible
+                    current_row = current_selection
+                    if current_row < scroll_offset:
+                        scroll_offset = current_row
+                    elif current_row >= scroll_offset + visible_height:
+                        scroll_offset = current_row - visible_height + 1
+
+                    if row_cache_width != terminal_size.width:
+                        row_cache.clear()
+                        row_cache_width = terminal_size.width
+
+                    visible_files = filtered_files[scroll_offset:scroll_offset + visible_height]
+                    row_keys = [
+                        (file_info.path, row + scroll_offset == current_selection)
+                        for row, file_info in enumerate(visible_files)
+                    ]
+
+                    # Build missing rows; files shown for the first time are formatted at once
+                    missing = [row for row, row_key in enumerate(row_keys) if row_key not in row_cache]
+                    if missing:
+                        new_files = [visible_files[row] for row in missing if visible_files[row].path not in file_details]
+                        if new_files:
+                            size_strs = format_file_sizes([file_info.size for file_info in new_files])
+                            mtime_strs = format_file_mtimes([file_info.mtime for file_info in new_files])
+                            for file_info, size_str, mtime_str in zip(new_files, size_strs, mtime_strs):
+                                # Git paths always use '/' - split once instead of basename + dirname
+                                file_dir, _, file_name = file_info.path.rpartition('/')
+                                file_details[file_info.path] = (file_dir, file_name, size_str, mtime_str)
+
+                        for row in missing:
+                            row_cache[row_keys[row]] = build_row(
+                                visible_files[row].path, row_keys[row][1], terminal_size.width
+                            )
 
-                # Add scroll indicator if needed
-                if len(filtered_files) > visible_height:
-                    file_content.append(Text(""))
-                    scroll_info = Text(
-                        f"Showing {scroll_offset + 1}-{min(scroll_offset + visible_height, len(filtered_files))} of {len(filtered_files)}",
-                        style=MAT_TEXT_HINT
-                    )
-                    file_content.append(scroll_info)
+                    file_content.extend(row_cache[row_key] for row_key in row_keys)
 
-            # Add options section
-            options_lines = create_compact_options_section(len(files), bool(files))
-            file_content.append(Text(""))
-            file_content.append(Text("─" * 60, style=MAT_TEXT_HINT))
-            file_content.extend(options_lines)
+                    # Add scroll indicator if needed
+                    if len(filtered_files) > visible_height:
+                        file_content.append(Text(""))
+                        scroll_info = Text(
+                            f"Showing {scroll_offset + 1}-{min(scroll_offset + visible_height, len(filtered_files))} of {len(filtered_files)}",
+                            style=MAT_TEXT_HINT
+                        )
+                        file_content.append(scroll_info)
 
-            # Display panel
-            panel = Panel(
-                Group(*file_content),
-                title="📋 TRACKED FILES",
-                title_align="left",
-                border_style=MAT_ACCENT,
-                padding=(0, 1)
-            )
+                # Add options section
+                options_lines = create_compact_options_section(len(files), bool(files))
+                file_content.append(Text(""))
+                file_content.append(Text("─" * 60, style=MAT_TEXT_HINT))
+                file_content.extend(options_lines)
 
-            self.console.print(panel)
+                # Display panel (built before the loop, only its content changes)
+                panel_content.renderables[:] = file_content
+                live.update(panel, refresh=True)
 
-            # Get user input
-            key = get_key()
+                # Get user input - keys that change nothing are skipped without a redraw
+                key = get_key()
+                while not _is_view_key(key, search_mode, TRACKED_KEYS):
+                    key = get_key()
 
-            # Handle search mode input
-            if search_mode:
-                if key == KeyCodes.ENTER:
-                    # Confirm search (Enter key)
-                    search_mode = False
-                elif key == KeyCodes.ESC:
-                    # Cancel search (Escape key)
-                    search_mode = False
-                    search_term = ""
-                    current_selection = 0
-                elif key == KeyCodes.BACKSPACE or key == '\b':
-                    # Remove character from search (Backspace key)
-                    if search_term:
-                        search_term = search_term[:-1]
+                # Handle search mode input
+                if search_mode:
+                    if key == KeyCodes.ENTER:
+                        # Confirm search (Enter key)
+                        search_mode = False
+                    elif key == KeyCodes.ESC:
+                        # Cancel search (Escape key)
+                        search_mode = False
+                        search_term = ""
                         current_selection = 0
-                elif len(key) == 1 and key.isprintable():
-                    # Add character to search term (printable characters)
-                    search_term += key
-                    current_selection = 0  # Reset selection when searching
-                continue
-
-            # Navigation
-            if key == KeyCodes.ARROW_UP or key.lower() == 'k':
-                if filtered_files:
-                    current_selection = (current_selection - 1) % len(filtered_files)
-            elif key == KeyCodes.ARROW_DOWN or key.lower() == 'j':
-                if filtered_files:
-                    current_selection = (current_selection + 1) % len(filtered_files)
-            elif key == KeyCodes.PAGE_UP:
-                if filtered_files:
-                    current_selection = max(0, current_selection - visible_height)
-            elif key == KeyCodes.PAGE_DOWN:
-                if filtered_files:
-                    current_selection = min(len(filtered_files) - 1, current_selection + visible_height)
-
-            # Actions
-            elif key == KeyCodes.ENTER:
-                # Future: View file history across commits
-                if filtered_files and current_selection < len(filtered_files):
-                    current_file = filtered_files[current_selection]
-                    # TODO: Implement file history viewer
-                    self.show_info(f"File history '{current_file.path}' - Feature in development")
-                    self.console.print(f"\n[{MAT_TEXT_SECONDARY}]Press any key to continue...[/]")
-                    get_key()
+                    elif key == KeyCodes.BACKSPACE or key == '\b':
+                        # Remove character from search (Backspace key)
+                        if search_term:
+                            search_term = search_term[:-1]
+                            current_selection = 0
+                    elif len(key) == 1 and key.isprintable():
+                        # Add character to search term (printable characters), with the rest of a paste
+                        search_term += key + ''.join(take_queued_keys(_is_printable_key))
+                        current_selection = 0  # Reset selection when searching
+                    continue
 
-            elif key == '/':  # Start search
-                search_mode = True
-                search_term = ""
-                current_selection = 0
+                # Navigation
+                if key == KeyCodes.ARROW_UP or key.lower() == 'k':
+                    # A held key moves in one step
+                    steps = 1 + len(take_queued_keys(key.__eq__))
+                    if filtered_files:
+                        current_selection = (current_selection - steps) % len(filtered_files)
+                elif key == KeyCodes.ARROW_DOWN or key.lower() == 'j':
+                    steps = 1 + len(take_queued_keys(key.__eq__))
+                    if filtered_files:
+                        current_selection = (current_selection + steps) % len(filtered_files)
+                elif key == KeyCodes.PAGE_UP:
+                    if filtered_files:
+                        current_selection = max(0, current_selection - visible_height)
+                elif key == KeyCodes.PAGE_DOWN:
+                    if filtered_files:
+                        current_selection = min(len(filtered_files) - 1, current_selection + visible_height)
+
+                # Actions
+                elif key == KeyCodes.ENTER:
+                    # Future: View file history across commits
+                    if filtered_files and current_selection < len(filtered_files):
+                        current_file = filtered_files[current_selection]
+                        # TODO: Implement file history viewer
+                        self.show_info(f"File history '{current_file.path}' - Feature in development")
+                        self.console.print(f"\n[{MAT_TEXT_SECONDARY}]Press any key to continue...[/]")
+                        get_key()
 
-            elif key.lower() == 'q' or key == KeyCodes.ESC:
-                if search_term:  # Clear search first if active
+                elif key == '/':  # Start search
+                    search_mode = True
                     search_term = ""
                     current_selection = 0
-                else:
-                    return None
 
-    def show_modified_files(self, changes: List[GitChange]) -> Optional[Dict[str, Any]]:
+                elif key.lower() == 'q' or key == KeyCodes.ESC:
+                    if search_term:  # Clear search first if active
+                        search_term = ""
+                        current_selection = 0
+                    else:
+                        return None
+
+    def show_modified_files(self, changes: List[GitChange], git_manager) -> Optional[Dict[str, Any]]:
         """Display modified files with scrollable table and file browser style controls"""
         current_selection = 0
         scroll_offset = 0
@@ -820,27 +1172,8 @@ class RichUI(UIInterface):
         search_term = ""
         search_mode = False
 
-        from ..core.git_manager import GitManager
-        from ..core.config_manager import ConfigManager
-
-        # Create temporary instances for parsing
-        config_manager = ConfigManager()
-        git_manager = GitManager(config_manager)
-
-        def filter_changes(changes_list, search):
-            """Filter changes based on search term"""
-            if not search:
-                return changes_list
-
-            search_lower = search.lower()
-            filtered = []
-
-            for change in changes_list:
-                # Search in file path (both filename and directory)
-                if search_lower in change.file.lower():
-                    filtered.append(change)
-
-            return filtered
+        # Search in file path (both filename and directory), lowercased once per change list
+        filter_changes = _FilterCache(lambda change: change.file).filter
 
         def create_compact_options_section(selected_count, total_count, has_changes, has_commits_to_push, has_commits_to_pull):
             """Create compact options section similar to file browser"""
@@ -894,6 +1227,9 @@ class RichUI(UIInterface):
 
             return controls_line + [status_line]
 
+        # Options sections by their inputs - most keys change none of them
+        options_cache: Dict[tuple, List[Text]] = {}
+
         # Static push/pull status - load once at entry and update only on manual refresh
         push_pull_status = {
             'has_remote': False,
@@ -904,8 +1240,10 @@ class RichUI(UIInterface):
 
         def load_push_pull_status():
             """Load push/pull status once - called on entry and manual refresh"""
-            has_remote, commits_ahead, _ = git_manager.get_push_status()
-            _, commits_behind, _ = git_manager.get_pull_status()
+            # Ahead and behind come from a single fetch + log
+            has_remote, commits_to_push, commits_to_pull = git_manager.get_sync_status()
+            commits_ahead = len(commits_to_push)
+            commits_behind = len(commits_to_pull)
             push_pull_status.update({
                 'has_remote': has_remote,
                 'commits_ahead': commits_ahead,
@@ -913,14 +1251,75 @@ class RichUI(UIInterface):
                 'loaded': True
             })
 
+        def build_row(change, is_current, is_selected, width):
+            """Build the Text of one change row"""
+            # File info
+            file_path = change.file
+            # Git paths always use '/' - split once instead of basename + dirname
+            file_dir, _, file_name = file_path.rpartition('/')
+
+            # Selection indicator
+            if is_selected:
+                selection_icon = "🍌"  # Selected (banana emoji)
+            else:
+                selection_icon = "　"  # Unselected (wide space)
+
+            # Git status with colors
+            status_char, status_color = self._get_status_char_and_color(change.staged, change.worktree)
+
+            # Row styling
+            if is_current:
+                prefix = "►"
+                base_style = STYLE_CURRENT
+                filename_style = STYLE_CURRENT
+                dir_style = STYLE_CURRENT_DIM
+            elif is_selected:
+                prefix = " "
+                base_style = STYLE_CURRENT
+                filename_style = STYLE_CURRENT
+                dir_style = STYLE_CURRENT_DIM
+            else:
+                prefix = " "
+                base_style = STYLE_PRIMARY
+                filename_style = STYLE_PRIMARY
+                dir_style = STYLE_DIM
+
+            # Calculate available width for file path
+            available_width = width - 20  # Reserve space for status and selection
+
+            # Format file path elegantly
+            display_dir, display_name = _fit_row_path(file_dir, file_name, available_width)
+            if display_dir:
+                # Show directory in dim style + filename in normal
+                file_text = Text.assemble(
+                    (f"{prefix} {selection_icon} ", base_style),
+                    (f"{status_char} ", status_color),
+                    (display_dir + "/", dir_style),
+                    (display_name, filename_style)
+                )
+            else:
+                # Just filename
+                file_text = Text.assemble(
+                    (f"{prefix} {selection_icon} ", base_style),
+                    (f"{status_char} ", status_color),
+                    (display_name, filename_style)
+                )
+
+            return file_text
+
+        # Row Texts by (path, is current row, is selected) for the current width - a key
+        # rebuilds only the rows whose markers changed
+        row_cache: Dict[tuple, Text] = {}
+        row_cache_width = 0
+
         # Load status once on page entry
         load_push_pull_status()
 
         while True:
-            self.console.clear()
+            self._clear_screen()
 
             # Get terminal size for scrolling
-            terminal_size = self.console.size
+            terminal_size = self._terminal_size()
             terminal_height = terminal_size.height
 
             # Calculate available space for table
@@ -938,7 +1337,7 @@ class RichUI(UIInterface):
             # Add search line with material colors
             if search_mode:
                 search_display = f"Search: {search_term}_"
-                search_style = f"bold {MAT_ACCENT}"
+                search_style = STYLE_SEARCH_ACTIVE
             elif search_term:
                 search_display = f"Filter: {search_term} (showing {len(filtered_changes)}/{len(changes)})"
                 search_style = MAT_PRIMARY
@@ -952,10 +1351,10 @@ class RichUI(UIInterface):
 
             if not filtered_changes:
                 if search_term:
-                    file_content.append(Text("No files found with search term", style=f"{MAT_PRIMARY}"))
-                    file_content.append(Text(f"Search among {len(changes)} modified files", style=f"{MAT_TEXT_SECONDARY}"))
+                    file_content.append(Text("No files found with search term", style=MAT_PRIMARY))
+                    file_content.append(Text(f"Search among {len(changes)} modified files", style=MAT_TEXT_SECONDARY))
                 else:
-                    file_content.append(Text("No changes detected", style=f"{MAT_PRIMARY}"))
+                    file_content.append(Text("No changes detected", style=MAT_PRIMARY))
 
                     sync_messages = []
                     if has_commits_to_push:
@@ -965,9 +1364,9 @@ class RichUI(UIInterface):
 
                     if sync_messages:
                         for msg in sync_messages:
-                            file_content.append(Text(msg, style=f"{MAT_ACCENT}"))
+                            file_content.append(Text(msg, style=MAT_ACCENT))
                     else:
-                        file_content.append(Text("All tracked files are up to date", style=f"{MAT_TEXT_SECONDARY}"))
+                        file_content.append(Text("All tracked files are up to date", style=MAT_TEXT_SECONDARY))
             else:
                 # Ensure current_selection is within bounds
                 if current_selection >= len(filtered_changes):
@@ -980,81 +1379,17 @@ class RichUI(UIInterface):
                 elif current_row >= scroll_offset + visible_height:
                     scroll_offset = current_row - visible_height + 1
 
-                # Display visible rows with elegant formatting
-                for row in range(visible_height):
-                    actual_row = row + scroll_offset
-
-                    if actual_row < len(filtered_changes):
-                        change = filtered_changes[actual_row]
-
-                        # File info
-                        file_path = change.file
-                        file_name = os.path.basename(file_path)
-                        file_dir = os.path.dirname(file_path)
-
-                        # Selection and current indicators
-                        is_selected = change.file in selected_files
-                        is_current = actual_row == current_selection
-
-                        # Selection indicator
-                        if is_selected:
-                            selection_icon = "🍌"  # Selected (banana emoji)
-                        else:
-                            selection_icon = "　"  # Unselected (wide space)
-
-                        # Git status with colors
-                        status_char, status_color = self._get_status_char_and_color(change.staged, change.worktree)
-
-                        # Row styling
-                        if is_current:
-                            prefix = "►"
-                            base_style = f"bold {MAT_BANANA}"
-                            filename_style = f"bold {MAT_BANANA}"
-                            dir_style = f"dim {MAT_BANANA}"
-                        elif is_selected:
-                            prefix = " "
-                            base_style = f"bold {MAT_BANANA}"
-                            filename_style = f"bold {MAT_BANANA}"
-                            dir_style = f"dim {MAT_BANANA}"
-                        else:
-                            prefix = " "
-                            base_style = MAT_PRIMARY
-                            filename_style = MAT_PRIMARY
-                            dir_style = f"dim {MAT_TEXT_SECONDARY}"
-
-                        # Calculate available width for file path
-                        available_width = terminal_size.width - 20  # Reserve space for status and selection
-
-                        # Format file path elegantly
-                        if file_dir and file_dir != ".":
-                            # Show directory in dim style + filename in normal
-                            if len(file_path) > available_width:
-                                # Truncate directory if too long
-                                truncated_dir = "..." + file_dir[-(available_width - len(file_name) - 10):]
-                                display_path = f"{truncated_dir}/{file_name}"
-                            else:
-                                display_path = file_path
-
-                            file_text = Text.assemble(
-                                (f"{prefix} {selection_icon} ", base_style),
-                                (f"{status_char} ", status_color),
-                                (os.path.dirname(display_path) + "/", dir_style),
-                                (os.path.basename(display_path), filename_style)
-                            )
-                        else:
-                            # Just filename
-                            if len(file_name) > available_width:
-                                display_name = file_name[:available_width - 3] + "..."
-                            else:
-                                display_name = file_name
+                if row_cache_width != terminal_size.width:
+                    row_cache.clear()
+                    row_cache_width = terminal_size.width
 
-                            file_text = Text.assemble(
-                                (f"{prefix} {selection_icon} ", base_style),
-                                (f"{status_char} ", status_color),
-                                (display_name, filename_style)
-                            )
-
-                        file_content.append(file_text)
+                # Display visible rows with elegant formatting
+                for row, change in enumerate(filtered_changes[scroll_offset:scroll_offset + visible_height]):
+                    row_key = (change.file, row + scroll_offset == current_selection, change.file in selected_files)
+                    file_text = row_cache.get(row_key)
+                    if file_text is None:
+                        file_text = row_cache[row_key] = build_row(change, row_key[1], row_key[2], terminal_size.width)
+                    file_content.append(file_text)
 
                 # Add scroll indicator if needed
                 if len(filtered_changes) > visible_height:
@@ -1066,7 +1401,10 @@ class RichUI(UIInterface):
                     file_content.append(scroll_info)
 
             # Add options section
-            options_lines = create_compact_options_section(len(selected_files), len(changes), bool(changes), has_commits_to_push, has_commits_to_pull)
+            options_key = (len(selected_files), len(changes), bool(changes), has_commits_to_push, has_commits_to_pull)
+            options_lines = options_cache.get(options_key)
+            if options_lines is None:
+                options_lines = options_cache[options_key] = create_compact_options_section(*options_key)
             file_content.append(Text(""))
             file_content.append(Text("─" * 60, style=MAT_TEXT_HINT))
             file_content.extend(options_lines)
@@ -1082,8 +1420,10 @@ class RichUI(UIInterface):
 
             self.console.print(panel)
 
-            # Get user input
+            # Get user input - keys that change nothing are skipped without a redraw
             key = get_key()
+            while not _is_view_key(key, search_mode, MODIFIED_KEYS):
+                key = get_key()
 
             # Handle search mode input
             if search_mode:
@@ -1237,7 +1577,7 @@ class RichUI(UIInterface):
         current_selection = 0
 
         while True:
-            self.console.clear()
+            self._clear_screen()
 
             # Get current config for display
             from ..core.config_manager import ConfigManager
@@ -1313,7 +1653,7 @@ class RichUI(UIInterface):
         edit_value = ""
 
         while True:
-            self.console.clear()
+            self._clear_screen()
 
             # Build compact form content
             form_content = []
@@ -1489,7 +1829,7 @@ class RichUI(UIInterface):
 
     def initialize_git_repo_detailed(self, config: Dict[str, str]) -> bool:
         """Show detailed git repository initialization interface"""
-        self.console.clear()
+        self._clear_screen()
 
         # Get settings
         git_dir = os.path.expanduser(config.get('git_dir', '~/.dotfiles.git'))
@@ -1531,7 +1871,7 @@ class RichUI(UIInterface):
         get_key()
 
         # Clear screen after user reads the information
-        self.console.clear()
+        self._clear_screen()
 
         # Check if git directory already exists
         if os.path.exists(git_dir):
@@ -1642,25 +1982,19 @@ class RichUI(UIInterface):
 
         return True  # Proceed with initialization
 
-    def show_backup_manager(self):
+    def show_backup_manager(self, git_manager):
         """Show backup management interface"""
-        from ..core.git_manager import GitManager
-        from ..core.config_manager import ConfigManager
-
-        config_manager = ConfigManager()
-        git_manager = GitManager(config_manager)
-
         current_selection = 0
         scroll_offset = 0
 
         while True:
-            self.console.clear()
+            self._clear_screen()
 
             # Get backup list
             backups = git_manager.get_backup_directories()
 
             # Get terminal size for scrolling
-            terminal_size = self.console.size
+            terminal_size = self._terminal_size()
             terminal_height = terminal_size.height
             # Account for: title(1) + empty(1) + header(1) + empty(1) + footer(1) + empty(1) + controls(1) + panel borders(2) + margins(2)
             available_height = terminal_height - 12  # More conservative
@@ -1784,17 +2118,17 @@ class RichUI(UIInterface):
                     backup = backups[current_selection]
                     if git_manager.delete_backup(backup['name']):
                         self.show_success("Backup deleted!")
-                        time.sleep(1)
+                        self.schedule_dismiss_after(1)
                         # Adjust selection if we deleted the last item
                         if current_selection >= len(git_manager.get_backup_directories()):
                             current_selection = max(0, len(git_manager.get_backup_directories()) - 1)
                     else:
                         self.show_error("Error deleting backup!")
-                        time.sleep(1)
+                        self.schedule_dismiss_after(1)
 
     def edit_gitignore(self) -> bool:
         """Show .gitignore editing interface"""
-        self.console.clear()
+        self._clear_screen()
 
         gitignore_panel = Panel(
             Group(
@@ -1827,7 +2161,7 @@ class RichUI(UIInterface):
         scroll_offset = 0
 
         while True:
-            self.console.clear()
+            self._clear_screen()
 
             # Read log file
             log_lines = []
@@ -1844,7 +2178,7 @@ class RichUI(UIInterface):
                 log_lines = [f"Error reading log file: {str(e)}"]
 
             # Get terminal size for scrolling - optimize for full window usage
-            terminal_size = self.console.size
+            terminal_size = self._terminal_size()
             visible_height = max(1, terminal_size.height - 8)  # Minimal space for header/controls
 
             # Ensure current_line is within bounds